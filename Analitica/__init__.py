@@ -0,0 +1,6 @@
+# Archivo __init__.py para el paquete analitica
+# Este archivo permite importar las clases del paquete
+
+from .almacen_columnar import AlmacenColumnar
+
+__all__ = ['AlmacenColumnar']
@@ -0,0 +1,193 @@
+import threading
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él los agregados se calculan recorriendo las columnas
+    np = None
+
+class AlmacenColumnar:
+    """Copia por columnas de los vuelos, tickets y equipajes para calcular agregados.
+    
+    Cada tabla es un conjunto de columnas `array` de igual largo (una fila
+    por vuelo, ticket o equipaje) que se agregan al final en O(1). Los
+    tickets y equipajes cancelados no se borran: se marcan como inactivos,
+    y los de vuelos cancelados se descartan al agregar mirando el estado del
+    vuelo. Con NumPy los agregados se calculan sobre las columnas con
+    operaciones vectorizadas; sin NumPy, con un recorrido en Python.
+    
+    Tiene su propio candado, así que se puede actualizar desde operaciones
+    que tienen tomados candados de vuelos distintos.
+    """
+    
+    def __init__(self):
+        self._candado = threading.Lock()
+        # Categorías: cada compañía y cada ruta (origen, destino) tienen un índice
+        self._companias = []
+        self._indice_compania = {}
+        self._rutas = []
+        self._indice_ruta = {}
+        # Vuelos
+        self._fila_vuelo = {}  # Código -> fila
+        self.vuelo_compania = array("i")
+        self.vuelo_ruta = array("i")
+        self.vuelo_mes = array("i")  # año * 12 + mes - 1
+        self.vuelo_capacidad = array("i")
+        self.vuelo_activo = array("b")
+        # Tickets
+        self._fila_ticket = {}  # (código de vuelo, número) -> fila
+        self.ticket_vuelo = array("i")
+        self.ticket_activo = array("b")
+        # Equipajes
+        self._fila_equipaje = {}  # Código -> fila
+        self.equipaje_vuelo = array("i")
+        self.equipaje_peso = array("d")
+        self.equipaje_costo = array("d")
+        self.equipaje_activo = array("b")
+    
+    def __getstate__(self):
+        """Estado para pickle, sin el candado"""
+        return {k: v for k, v in vars(self).items() if k != "_candado"}
+    
+    def __setstate__(self, estado):
+        """Restaura el estado de pickle con un candado nuevo"""
+        vars(self).update(estado)
+        self._candado = threading.Lock()
+    
+    def __len__(self):
+        """Cantidad de filas de tickets"""
+        return len(self.ticket_vuelo)
+    
+    # ========== ALTAS Y BAJAS ==========
+    
+    def agregar_vuelo(self, vuelo):
+        """Agrega la fila de un vuelo nuevo"""
+        with self._candado:
+            self._fila_vuelo[vuelo.codigo] = len(self.vuelo_activo)
+            self.vuelo_compania.append(self._indice(self._companias, self._indice_compania, vuelo.compania.codigo))
+            self.vuelo_ruta.append(self._indice(self._rutas, self._indice_ruta, (vuelo.origen, vuelo.destino)))
+            self.vuelo_mes.append(vuelo.fecha.year * 12 + vuelo.fecha.month - 1)
+            self.vuelo_capacidad.append(vuelo.capacidad_asientos)
+            self.vuelo_activo.append(1)
+    
+    def cancelar_vuelo(self, vuelo):
+        """Marca un vuelo como cancelado; sus tickets y equipajes dejan de contar"""
+        with self._candado:
+            self.vuelo_activo[self._fila_vuelo[vuelo.codigo]] = 0
+    
+    def agregar_ticket(self, ticket):
+        """Agrega la fila de un ticket vendido (si ya estaba, lo vuelve a marcar activo)"""
+        clave = (ticket.codigo_vuelo, ticket.numero)
+        with self._candado:
+            fila = self._fila_ticket.get(clave)
+            if fila is not None:
+                self.ticket_activo[fila] = 1
+                return
+            self._fila_ticket[clave] = len(self.ticket_activo)
+            self.ticket_vuelo.append(self._fila_vuelo[ticket.codigo_vuelo])
+            self.ticket_activo.append(1)
+    
+    def quitar_ticket(self, ticket):
+        """Marca un ticket como cancelado"""
+        with self._candado:
+            fila = self._fila_ticket.get((ticket.codigo_vuelo, ticket.numero))
+            if fila is not None:
+                self.ticket_activo[fila] = 0
+    
+    def agregar_equipaje(self, equipaje, codigo_vuelo):
+        """Agrega la fila de un equipaje registrado en un vuelo"""
+        with self._candado:
+            self._fila_equipaje[equipaje.codigo] = len(self.equipaje_activo)
+            self.equipaje_vuelo.append(self._fila_vuelo[codigo_vuelo])
+            self.equipaje_peso.append(equipaje.peso)
+            self.equipaje_costo.append(equipaje.costo)
+            self.equipaje_activo.append(1)
+    
+    def actualizar_costo_equipaje(self, codigo, costo):
+        """Cambia el costo de un equipaje recotizado"""
+        with self._candado:
+            fila = self._fila_equipaje.get(codigo)
+            if fila is not None:
+                self.equipaje_costo[fila] = costo
+    
+    def quitar_equipaje(self, codigo):
+        """Marca un equipaje como retirado"""
+        with self._candado:
+            fila = self._fila_equipaje.get(codigo)
+            if fila is not None:
+                self.equipaje_activo[fila] = 0
+    
+    # ========== AGREGADOS ==========
+    
+    def ingresos_equipaje_por_compania_y_mes(self):
+        """Retorna {(código de compañía, "AAAA-MM"): total cobrado por sobrepeso} de los vuelos activos"""
+        with self._candado:
+            companias = list(self._companias)
+            (v_compania, v_mes, v_activo, e_vuelo, e_costo, e_activo) = self._copiar(
+                self.vuelo_compania, self.vuelo_mes, self.vuelo_activo,
+                self.equipaje_vuelo, self.equipaje_costo, self.equipaje_activo)
+        
+        if np is not None:
+            filas = (e_activo == 1) & (v_activo[e_vuelo] == 1) & (e_costo > 0)
+            vuelos = e_vuelo[filas]
+            # Una clave entera por (compañía, mes) para agrupar con unique + bincount
+            claves = v_compania[vuelos].astype(np.int64) << 32 | v_mes[vuelos]
+            grupos, posiciones = np.unique(claves, return_inverse=True)
+            totales = np.bincount(posiciones, weights=e_costo[filas], minlength=len(grupos))
+            pares = zip((grupos >> 32).tolist(), (grupos & 0xFFFFFFFF).tolist(), totales.tolist())
+        else:
+            sumas = {}
+            for vuelo, costo, activo in zip(e_vuelo, e_costo, e_activo):
+                if activo and v_activo[vuelo] and costo > 0:
+                    clave = (v_compania[vuelo], v_mes[vuelo])
+                    sumas[clave] = sumas.get(clave, 0) + costo
+            pares = ((compania, mes, total) for (compania, mes), total in sorted(sumas.items()))
+        
+        return {(companias[compania], f"{mes // 12}-{mes % 12 + 1:02d}"): total for compania, mes, total in pares}
+    
+    def ocupacion_por_ruta(self):
+        """Retorna {(origen, destino): ocupación promedio} de los vuelos activos, entre 0 y 1"""
+        with self._candado:
+            rutas = list(self._rutas)
+            (v_ruta, v_capacidad, v_activo, t_vuelo, t_activo) = self._copiar(
+                self.vuelo_ruta, self.vuelo_capacidad, self.vuelo_activo, self.ticket_vuelo, self.ticket_activo)
+        
+        if np is not None:
+            vendidos = np.bincount(t_vuelo[t_activo == 1], minlength=len(v_activo))
+            filas = (v_activo == 1) & (v_capacidad > 0)
+            ocupacion = vendidos[filas] / v_capacidad[filas]
+            vuelos_por_ruta = np.bincount(v_ruta[filas], minlength=len(rutas))
+            suma_por_ruta = np.bincount(v_ruta[filas], weights=ocupacion, minlength=len(rutas))
+            pares = ((ruta, suma_por_ruta[ruta] / cantidad)
+                     for ruta, cantidad in enumerate(vuelos_por_ruta.tolist()) if cantidad)
+        else:
+            vendidos = [0] * len(v_activo)
+            for vuelo, activo in zip(t_vuelo, t_activo):
+                if activo:
+                    vendidos[vuelo] += 1
+            sumas = {}
+            for vuelo, (ruta, capacidad, activo) in enumerate(zip(v_ruta, v_capacidad, v_activo)):
+                if activo and capacidad > 0:
+                    suma, cantidad = sumas.get(ruta, (0, 0))
+                    sumas[ruta] = (suma + vendidos[vuelo] / capacidad, cantidad + 1)
+            pares = ((ruta, suma / cantidad) for ruta, (suma, cantidad) in sorted(sumas.items()))
+        
+        return {rutas[ruta]: float(promedio) for ruta, promedio in pares}
+    
+    # ========== MÉTODOS AUXILIARES ==========
+    
+    @staticmethod
+    def _indice(valores, indices, valor):
+        """Índice de un valor de categoría, agregándolo si es nuevo"""
+        indice = indices.get(valor)
+        if indice is None:
+            indice = indices[valor] = len(valores)
+            valores.append(valor)
+        return indice
+    
+    @staticmethod
+    def _copiar(*columnas):
+        """Copia columnas (como arreglos de NumPy si está disponible) para calcular sin el candado"""
+        if np is not None:
+            return [np.frombuffer(columna, dtype=columna.typecode).copy() for columna in columnas]
+        return [array(columna.typecode, columna) for columna in columnas]
@@ -8,5 +8,8 @@ from .compania import Compania
 from .vuelo import Vuelo
 from .ticket import Ticket
 from .equipaje import Equipaje
+from .mapa_asientos import MapaAsientos
+from .reserva import Reserva
+from .tarifario import Tarifario
 
-__all__ = ['Persona', 'Cliente', 'Tripulante', 'Compania', 'Vuelo', 'Ticket', 'Equipaje']
\ No newline at end of file
+__all__ = ['Persona', 'Cliente', 'Tripulante', 'Compania', 'Vuelo', 'Ticket', 'Equipaje', 'MapaAsientos', 'Reserva', 'Tarifario']
\ No newline at end of file
@@ -4,11 +4,20 @@ from datetime import datetime
 class Cliente(Persona):
     """Clase que representa un cliente/pasajero del sistema"""
     
+    __slots__ = ("nacionalidad", "fecha_ingreso", "_historial_vuelos")
+    
     def __init__(self, documento, apellido, nombre, email, celular, nacionalidad):
         super().__init__(documento, apellido, nombre, email, celular)
         self.nacionalidad = nacionalidad
         self.fecha_ingreso = datetime.now()
-        self.historial_vuelos = []
+        self._historial_vuelos = None  # La lista se crea con el primer vuelo
+    
+    @property
+    def historial_vuelos(self):
+        """Códigos de los vuelos del cliente, en orden"""
+        if self._historial_vuelos is None:
+            self._historial_vuelos = []
+        return self._historial_vuelos
     
     def obtener_tipo(self):
         return "Cliente"
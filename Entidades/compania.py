@@ -1,10 +1,39 @@
 class Compania:
     """Clase que representa una compañía aérea"""
     
+    __slots__ = ("codigo", "nombre", "pais_origen", "_vuelos", "_cantidad_cancelados")
+    
     def __init__(self, codigo, nombre, pais_origen):
         self.codigo = codigo
         self.nombre = nombre
         self.pais_origen = pais_origen
+        self._vuelos = {}  # Vuelos de la compañía por código (conserva el orden de creación)
+        self._cantidad_cancelados = 0
+    
+    @property
+    def vuelos(self):
+        """Vista ordenada de los vuelos de la compañía"""
+        return self._vuelos.values()
+    
+    def agregar_vuelo(self, vuelo):
+        """Agrega un vuelo nuevo de la compañía"""
+        self._vuelos[vuelo.codigo] = vuelo
+    
+    def registrar_cancelacion(self):
+        """Cuenta un vuelo de la compañía que se canceló"""
+        self._cantidad_cancelados += 1
+    
+    def cantidad_vuelos(self):
+        """Retorna la cantidad total de vuelos de la compañía"""
+        return len(self._vuelos)
+    
+    def cantidad_activos(self):
+        """Retorna la cantidad de vuelos activos de la compañía"""
+        return len(self._vuelos) - self._cantidad_cancelados
+    
+    def cantidad_cancelados(self):
+        """Retorna la cantidad de vuelos cancelados de la compañía"""
+        return self._cantidad_cancelados
     
     def __str__(self):
-        return f"{self.nombre} ({self.codigo}) - {self.pais_origen}"
\ No newline at end of file
+        return f"{self.nombre} ({self.codigo}) - {self.pais_origen}"
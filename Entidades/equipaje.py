@@ -1,6 +1,10 @@
+from Entidades.tarifario import Tarifario
+
 class Equipaje:
     """Clase que representa equipaje en bodega"""
     
+    __slots__ = ("codigo", "pasajero", "peso", "costo", "es_internacional")
+    
     def __init__(self, codigo, pasajero, peso, costo, es_internacional):
         self.codigo = codigo  # Formato: CODIGOVUELO-NROTICKET
         self.pasajero = pasajero
@@ -10,15 +14,9 @@ class Equipaje:
     
     @staticmethod
     def calcular_costo(peso, es_internacional):
-        """Calcula el costo del equipaje según el peso y tipo de vuelo"""
-        if peso <= 23:
-            return 0
-        elif 24 <= peso <= 32:
-            return 100 if es_internacional else 30
-        elif 33 <= peso <= 45:
-            return 200 if es_internacional else 60
-        else:
-            raise ValueError("El equipaje no puede superar los 45 kg")
+        """Calcula el costo del equipaje según el peso y tipo de vuelo con la tarifa por defecto"""
+        precios = Tarifario.PRECIOS_INTERNACIONALES if es_internacional else Tarifario.PRECIOS_NACIONALES
+        return Tarifario.costo_en_tabla((Tarifario.LIMITES_POR_DEFECTO, precios), peso)
     
     def __str__(self):
         return f"Equipaje {self.codigo} - Pasajero: {self.pasajero.nombre} {self.pasajero.apellido} - Peso: {self.peso}kg - Costo: USD {self.costo}"
\ No newline at end of file
@@ -0,0 +1,66 @@
+from array import array
+
+class MapaAsientos:
+    """Inventario de los asientos de un vuelo, numerados de 1 a capacidad.
+    
+    La ocupación se guarda en un bitmap (un bit por asiento). Los asientos
+    que nunca se usaron se entregan en orden con un puntero y los que se
+    liberan se apilan para volver a usarse, así que ocupar y liberar son O(1).
+    """
+    
+    __slots__ = ("capacidad", "_bitmap", "_liberados", "_siguiente", "_ocupados")
+    
+    def __init__(self, capacidad):
+        self.capacidad = capacidad
+        self._bitmap = bytearray((capacidad + 8) // 8)
+        self._liberados = array("I")  # Pila de asientos liberados (puede tener asientos ya ocupados de nuevo)
+        self._siguiente = 1  # Primer asiento que todavía no se entregó nunca
+        self._ocupados = 0
+    
+    @property
+    def libres(self):
+        """Cantidad de asientos libres"""
+        return self.capacidad - self._ocupados
+    
+    def esta_ocupado(self, asiento):
+        """Retorna True si el asiento está ocupado"""
+        return bool(self._bitmap[asiento >> 3] & (1 << (asiento & 7)))
+    
+    def ocupar(self, asiento=None):
+        """Ocupa el asiento indicado, o uno libre cualquiera si no se indica. Retorna el número de asiento"""
+        if asiento is None:
+            asiento = self._asiento_libre()
+        elif not 1 <= asiento <= self.capacidad:
+            raise ValueError(f"El asiento debe estar entre 1 y {self.capacidad}")
+        elif self.esta_ocupado(asiento):
+            raise ValueError(f"El asiento {asiento} ya está ocupado")
+        
+        self._bitmap[asiento >> 3] |= 1 << (asiento & 7)
+        self._ocupados += 1
+        return asiento
+    
+    def liberar(self, asiento):
+        """Libera un asiento ocupado"""
+        if not 1 <= asiento <= self.capacidad or not self.esta_ocupado(asiento):
+            raise ValueError(f"El asiento {asiento} no está ocupado")
+        self._bitmap[asiento >> 3] &= ~(1 << (asiento & 7)) & 0xFF
+        self._ocupados -= 1
+        self._liberados.append(asiento)
+    
+    def asientos_libres(self):
+        """Genera los números de los asientos libres, en orden"""
+        return (asiento for asiento in range(1, self.capacidad + 1) if not self.esta_ocupado(asiento))
+    
+    def _asiento_libre(self):
+        """Retorna un asiento libre sin ocuparlo"""
+        if self._ocupados >= self.capacidad:
+            raise ValueError("No hay asientos disponibles en este vuelo")
+        
+        # Los asientos elegidos a mano pueden seguir en la pila o delante del puntero: se saltean
+        while self._liberados:
+            asiento = self._liberados.pop()
+            if not self.esta_ocupado(asiento):
+                return asiento
+        while self.esta_ocupado(self._siguiente):
+            self._siguiente += 1
+        return self._siguiente
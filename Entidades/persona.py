@@ -4,6 +4,9 @@ from datetime import datetime
 class Persona(ABC):
     """Clase abstracta que representa una persona en el sistema"""
     
+    # Las entidades usan __slots__ (sin __dict__ por instancia) porque puede haber millones
+    __slots__ = ("documento", "apellido", "nombre", "email", "celular")
+    
     def __init__(self, documento, apellido, nombre, email, celular):
         self.documento = documento
         self.apellido = apellido
@@ -0,0 +1,19 @@
+class Reserva:
+    """Clase que representa un asiento retenido para un pasajero hasta que confirme la compra"""
+    
+    __slots__ = ("codigo", "pasajero", "codigo_vuelo", "asiento", "creada", "vencimiento")
+    
+    def __init__(self, codigo, pasajero, codigo_vuelo, asiento, creada, vencimiento):
+        self.codigo = codigo  # Formato: CODIGOVUELO-RNRORESERVA
+        self.pasajero = pasajero  # Objeto Cliente
+        self.codigo_vuelo = codigo_vuelo
+        self.asiento = asiento  # Número de asiento; lo asigna el vuelo si no se elige
+        self.creada = creada  # Segundos desde epoch (time.time())
+        self.vencimiento = vencimiento  # Segundos desde epoch; después de esto se puede liberar
+    
+    def esta_vencida(self, ahora):
+        """Retorna True si la reserva ya venció en el momento indicado"""
+        return self.vencimiento <= ahora
+    
+    def __str__(self):
+        return f"Reserva {self.codigo} - Vuelo: {self.codigo_vuelo} - Asiento: {self.asiento} - Pasajero: {self.pasajero.nombre} {self.pasajero.apellido}"
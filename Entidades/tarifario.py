@@ -0,0 +1,81 @@
+import bisect
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él los lotes se calculan peso por peso
+    np = None
+
+class Tarifario:
+    """Tablas de precios de equipaje por tramos de peso.
+    
+    Cada tabla es un par (límites, precios): el tramo i cubre los pesos
+    mayores al límite i-1 y hasta el límite i inclusive, y cuesta precios[i].
+    El tramo de un peso se encuentra con búsqueda binaria sobre los límites.
+    Hay tablas por compañía y ruta, por compañía y por defecto, separadas
+    para vuelos nacionales e internacionales; para un vuelo se usa la más
+    específica que exista.
+    """
+    
+    LIMITES_POR_DEFECTO = (23, 32, 45)  # kg
+    PRECIOS_NACIONALES = (0, 30, 60)  # USD
+    PRECIOS_INTERNACIONALES = (0, 100, 200)  # USD
+    
+    __slots__ = ("_tablas",)
+    
+    def __init__(self):
+        # (compañía, origen, destino, es_internacional) -> (límites, precios); None es "cualquiera"
+        self._tablas = {
+            (None, None, None, False): (self.LIMITES_POR_DEFECTO, self.PRECIOS_NACIONALES),
+            (None, None, None, True): (self.LIMITES_POR_DEFECTO, self.PRECIOS_INTERNACIONALES),
+        }
+    
+    def definir_tarifa(self, limites, precios, es_internacional, codigo_compania=None, origen=None, destino=None):
+        """Define la tabla de una compañía (y opcionalmente de una de sus rutas) o la tabla por defecto"""
+        limites = tuple(limites)
+        precios = tuple(precios)
+        if not limites or len(limites) != len(precios):
+            raise ValueError("Debe haber un precio por cada límite de peso")
+        if any(anterior >= siguiente for anterior, siguiente in zip(limites, limites[1:])) or limites[0] <= 0:
+            raise ValueError("Los límites de peso deben ser positivos y crecientes")
+        if any(precio < 0 for precio in precios):
+            raise ValueError("Los precios no pueden ser negativos")
+        if (origen is None) != (destino is None) or (origen is not None and codigo_compania is None):
+            raise ValueError("Una tarifa por ruta necesita compañía, origen y destino")
+        self._tablas[(codigo_compania, origen, destino, bool(es_internacional))] = (limites, precios)
+    
+    def obtener_tabla(self, vuelo):
+        """Retorna la tabla (límites, precios) que corresponde a un vuelo"""
+        internacional = vuelo.es_internacional()
+        codigo = vuelo.compania.codigo
+        return (self._tablas.get((codigo, vuelo.origen, vuelo.destino, internacional))
+                or self._tablas.get((codigo, None, None, internacional))
+                or self._tablas[(None, None, None, internacional)])
+    
+    def calcular_costo(self, vuelo, peso):
+        """Calcula el costo de un equipaje en un vuelo"""
+        return self.costo_en_tabla(self.obtener_tabla(vuelo), peso)
+    
+    def calcular_costos(self, vuelo, pesos):
+        """Calcula en una sola llamada el costo de una lista (o arreglo) de pesos en un vuelo"""
+        limites, precios = self.obtener_tabla(vuelo)
+        if np is None:
+            return [self.costo_en_tabla((limites, precios), peso) for peso in pesos]
+        
+        pesos = np.asarray(pesos, dtype=float)
+        if pesos.size and not (np.isfinite(pesos).all() and pesos.min() >= 0):
+            raise ValueError("El peso del equipaje debe ser un número finito y no negativo")
+        if pesos.size and pesos.max() > limites[-1]:
+            raise ValueError(f"El equipaje no puede superar los {limites[-1]} kg")
+        return np.asarray(precios)[np.searchsorted(limites, pesos, side="left")].tolist()
+    
+    @staticmethod
+    def costo_en_tabla(tabla, peso):
+        """Costo de un peso según una tabla (límites, precios)"""
+        limites, precios = tabla
+        if not math.isfinite(peso) or peso < 0:
+            raise ValueError("El peso del equipaje debe ser un número finito y no negativo")
+        tramo = bisect.bisect_left(limites, peso)
+        if tramo == len(limites):
+            raise ValueError(f"El equipaje no puede superar los {limites[-1]} kg")
+        return precios[tramo]
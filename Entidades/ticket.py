@@ -1,10 +1,13 @@
 class Ticket:
     """Clase que representa un ticket de vuelo"""
     
-    def __init__(self, numero, pasajero, codigo_vuelo):
-        self.numero = numero  # Número único dentro del vuelo (1..capacidad)
+    __slots__ = ("numero", "pasajero", "codigo_vuelo", "asiento")
+    
+    def __init__(self, numero, pasajero, codigo_vuelo, asiento=None):
+        self.numero = numero  # Número único dentro del vuelo (no se reutiliza al cancelar)
         self.pasajero = pasajero  # Objeto Cliente
         self.codigo_vuelo = codigo_vuelo
+        self.asiento = asiento  # Número de asiento; lo asigna el vuelo si no se elige
     
     def __str__(self):
-        return f"Ticket #{self.numero} - Vuelo: {self.codigo_vuelo} - Pasajero: {self.pasajero.nombre} {self.pasajero.apellido}"
\ No newline at end of file
+        return f"Ticket #{self.numero} - Vuelo: {self.codigo_vuelo} - Asiento: {self.asiento} - Pasajero: {self.pasajero.nombre} {self.pasajero.apellido}"
\ No newline at end of file
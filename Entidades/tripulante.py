@@ -1,11 +1,14 @@
 from Entidades.persona import Persona
 from datetime import datetime
+import bisect
 
 class Tripulante(Persona):
     """Clase que representa un tripulante (piloto, copiloto, azafata)"""
     
     ROLES_VALIDOS = ["piloto", "copiloto", "azafata", "azafato"]
     
+    __slots__ = ("rol", "fecha_ingreso_compania", "horas_vuelo", "_agenda")
+    
     def __init__(self, documento, apellido, nombre, email, celular, rol, fecha_ingreso_compania, horas_vuelo):
         super().__init__(documento, apellido, nombre, email, celular)
         if rol.lower() not in self.ROLES_VALIDOS:
@@ -13,6 +16,33 @@ class Tripulante(Persona):
         self.rol = rol.lower()
         self.fecha_ingreso_compania = fecha_ingreso_compania
         self.horas_vuelo = horas_vuelo
+        self._agenda = []  # (salida, llegada, código) de sus vuelos activos, ordenada por salida y sin superposiciones
+    
+    def buscar_conflicto(self, salida, llegada, descanso):
+        """Retorna el código del vuelo de la agenda que se superpone con el intervalo o no deja el descanso, o None.
+        
+        Como la agenda no tiene superposiciones alcanza con mirar el vuelo
+        anterior y el siguiente, que se encuentran con búsqueda binaria.
+        """
+        posicion = bisect.bisect_left(self._agenda, (salida,))
+        if posicion > 0 and self._agenda[posicion - 1][1] + descanso > salida:
+            return self._agenda[posicion - 1][2]
+        if posicion < len(self._agenda) and llegada + descanso > self._agenda[posicion][0]:
+            return self._agenda[posicion][2]
+        return None
+    
+    def agregar_a_agenda(self, salida, llegada, codigo_vuelo):
+        """Agrega un vuelo a la agenda (ya verificado con buscar_conflicto)"""
+        bisect.insort(self._agenda, (salida, llegada, codigo_vuelo))
+    
+    def quitar_de_agenda(self, salida, codigo_vuelo):
+        """Quita un vuelo de la agenda"""
+        posicion = bisect.bisect_left(self._agenda, (salida,))
+        while posicion < len(self._agenda) and self._agenda[posicion][0] == salida:
+            if self._agenda[posicion][2] == codigo_vuelo:
+                del self._agenda[posicion]
+                return
+            posicion += 1
     
     def obtener_tipo(self):
         return "Tripulante"
@@ -1,8 +1,15 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from Entidades.mapa_asientos import MapaAsientos
 
 class Vuelo:
     """Clase que representa un vuelo turístico"""
     
+    # causa_cancelacion y fecha_cancelacion se asignan recién al cancelar el vuelo
+    __slots__ = ("codigo", "origen", "destino", "duracion_horas", "fecha", "compania", "capacidad_asientos",
+                 "tipo_vuelo", "estado", "_tickets", "_tickets_por_documento", "_equipajes", "_cantidad_equipaje",
+                 "_ultimo_numero_ticket", "_reservas", "_reservas_por_documento", "_ultimo_numero_reserva",
+                 "asientos", "tripulacion", "causa_cancelacion", "fecha_cancelacion")
+    
     def __init__(self, codigo, origen, destino, duracion_horas, fecha, compania, capacidad_asientos, tipo_vuelo):
         self.codigo = codigo
         self.origen = origen
@@ -13,27 +20,98 @@ class Vuelo:
         self.capacidad_asientos = capacidad_asientos
         self.tipo_vuelo = tipo_vuelo.lower()  # "nacional" o "internacional"
         self.estado = "activo"
-        self.tickets = []  # Colección de tickets
-        self.equipajes = []  # Colección de equipajes en bodega
+        self._tickets = {}  # Tickets por número (conserva el orden de venta)
+        self._tickets_por_documento = {}  # Ticket de cada pasajero por documento
+        self._equipajes = {}  # Equipajes en bodega por código
+        self._cantidad_equipaje = {}  # Cantidad de equipajes por documento del pasajero
+        self._ultimo_numero_ticket = 0
+        self._reservas = {}  # Reservas pendientes por código
+        self._reservas_por_documento = {}  # Reserva pendiente de cada pasajero por documento
+        self._ultimo_numero_reserva = 0
+        self.asientos = MapaAsientos(capacidad_asientos)  # Ocupados por tickets y por reservas
         self.tripulacion = {
             "pilotos": [],
             "copilotos": [],
             "azafatas": []
         }
     
+    @property
+    def tickets(self):
+        """Vista ordenada de los tickets del vuelo"""
+        return self._tickets.values()
+    
+    @property
+    def reservas(self):
+        """Vista de las reservas pendientes del vuelo"""
+        return self._reservas.values()
+    
+    @property
+    def equipajes(self):
+        """Vista ordenada de los equipajes en bodega"""
+        return self._equipajes.values()
+    
+    def obtener_fecha_llegada(self):
+        """Retorna la fecha y hora de llegada del vuelo"""
+        return self.fecha + timedelta(hours=self.duracion_horas)
+    
     def es_internacional(self):
         """Retorna True si el vuelo es internacional"""
         return self.tipo_vuelo == "internacional"
     
     def obtener_asientos_disponibles(self):
         """Retorna la cantidad de asientos disponibles"""
-        return self.capacidad_asientos - len(self.tickets)
+        return self.asientos.libres
+    
+    def generar_numero_ticket(self):
+        """Retorna un número de ticket que no se repite dentro del vuelo"""
+        self._ultimo_numero_ticket += 1
+        return self._ultimo_numero_ticket
     
     def agregar_ticket(self, ticket):
-        """Agrega un ticket al vuelo"""
-        if len(self.tickets) >= self.capacidad_asientos:
-            raise ValueError("No hay asientos disponibles en este vuelo")
-        self.tickets.append(ticket)
+        """Agrega un ticket al vuelo ocupando su asiento (o uno libre si el ticket no tiene)"""
+        if ticket.numero in self._tickets:
+            raise ValueError(f"Ya existe el ticket #{ticket.numero} en este vuelo")
+        ticket.asiento = self.asientos.ocupar(ticket.asiento)
+        self._tickets[ticket.numero] = ticket
+        self._tickets_por_documento[ticket.pasajero.documento] = ticket
+        self._ultimo_numero_ticket = max(self._ultimo_numero_ticket, ticket.numero)
+    
+    def generar_codigo_reserva(self):
+        """Retorna un código de reserva que no se repite dentro del vuelo"""
+        self._ultimo_numero_reserva += 1
+        return f"{self.codigo}-R{self._ultimo_numero_reserva}"
+    
+    def agregar_reserva(self, reserva):
+        """Agrega una reserva al vuelo ocupando su asiento (o uno libre si la reserva no tiene)"""
+        if reserva.codigo in self._reservas:
+            raise ValueError(f"Ya existe la reserva {reserva.codigo} en este vuelo")
+        reserva.asiento = self.asientos.ocupar(reserva.asiento)
+        self._reservas[reserva.codigo] = reserva
+        self._reservas_por_documento[reserva.pasajero.documento] = reserva
+    
+    def obtener_reserva(self, codigo_reserva):
+        """Busca una reserva pendiente del vuelo por su código"""
+        return self._reservas.get(codigo_reserva)
+    
+    def obtener_reserva_por_documento(self, documento):
+        """Busca la reserva pendiente de un pasajero en el vuelo"""
+        return self._reservas_por_documento.get(documento)
+    
+    def quitar_reserva(self, codigo_reserva):
+        """Elimina una reserva del vuelo y libera su asiento"""
+        reserva = self._reservas.pop(codigo_reserva, None)
+        if reserva is not None:
+            self.asientos.liberar(reserva.asiento)
+            del self._reservas_por_documento[reserva.pasajero.documento]
+        return reserva
+    
+    def obtener_ticket(self, numero_ticket):
+        """Busca un ticket del vuelo por su número"""
+        return self._tickets.get(numero_ticket)
+    
+    def obtener_ticket_por_documento(self, documento):
+        """Busca el ticket de un pasajero en el vuelo"""
+        return self._tickets_por_documento.get(documento)
     
     def agregar_tripulante(self, tripulante):
         """Agrega un tripulante a la tripulación del vuelo"""
@@ -53,15 +131,34 @@ class Vuelo:
     
     def agregar_equipaje(self, equipaje):
         """Agrega equipaje al vuelo"""
-        self.equipajes.append(equipaje)
+        self._equipajes[equipaje.codigo] = equipaje
+        documento = equipaje.pasajero.documento
+        self._cantidad_equipaje[documento] = self._cantidad_equipaje.get(documento, 0) + 1
+    
+    def cantidad_equipaje(self, documento):
+        """Retorna la cantidad de equipajes registrados por un pasajero en el vuelo"""
+        return self._cantidad_equipaje.get(documento, 0)
     
     def quitar_equipaje(self, codigo_equipaje):
         """Elimina un equipaje del vuelo"""
-        self.equipajes = [e for e in self.equipajes if e.codigo != codigo_equipaje]
+        equipaje = self._equipajes.pop(codigo_equipaje, None)
+        if equipaje is not None:
+            documento = equipaje.pasajero.documento
+            if self._cantidad_equipaje[documento] == 1:
+                del self._cantidad_equipaje[documento]
+            else:
+                self._cantidad_equipaje[documento] -= 1
+        return equipaje
     
     def quitar_ticket(self, numero_ticket):
         """Elimina un ticket del vuelo"""
-        self.tickets = [t for t in self.tickets if t.numero != numero_ticket]
+        ticket = self._tickets.pop(numero_ticket, None)
+        if ticket is not None:
+            self.asientos.liberar(ticket.asiento)
+            documento = ticket.pasajero.documento
+            if self._tickets_por_documento.get(documento) is ticket:
+                del self._tickets_por_documento[documento]
+        return ticket
     
     def cancelar(self):
         """Cancela el vuelo"""
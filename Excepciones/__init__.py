@@ -7,7 +7,8 @@ from .excepciones import (
     DatoInvalidoException,
     VueloCompletoException,
     TripulacionIncompletaException,
-    EquipajeInvalidoException
+    EquipajeInvalidoException,
+    ConflictoTripulacionException
 )
 
 __all__ = [
@@ -16,5 +17,6 @@ __all__ = [
     'DatoInvalidoException',
     'VueloCompletoException',
     'TripulacionIncompletaException',
-    'EquipajeInvalidoException'
+    'EquipajeInvalidoException',
+    'ConflictoTripulacionException'
 ]
\ No newline at end of file
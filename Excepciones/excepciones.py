@@ -20,4 +20,8 @@ class TripulacionIncompletaException(Exception):
 
 class EquipajeInvalidoException(Exception):
     """Excepción relacionada con validación de equipaje"""
+    pass
+
+class ConflictoTripulacionException(Exception):
+    """Excepción cuando un tripulante ya tiene un vuelo que se superpone o no le deja el descanso mínimo"""
     pass
\ No newline at end of file
@@ -0,0 +1,2 @@
+# Archivo __init__.py para el paquete mediciones
+# Scripts de prueba de carga y medición; se ejecutan con python -m Mediciones.<script>
@@ -0,0 +1,89 @@
+import sys
+import time
+from datetime import datetime, timedelta
+import Analitica.almacen_columnar as almacen_columnar
+from Analitica import AlmacenColumnar
+from Entidades.cliente import Cliente
+from Entidades.compania import Compania
+from Entidades.equipaje import Equipaje
+from Entidades.ticket import Ticket
+from Entidades.vuelo import Vuelo
+
+CIUDADES = ["Montevideo", "Buenos Aires", "Santiago", "San Pablo", "Lima", "Asunción"]
+
+def poblar(vuelos, capacidad):
+    """Crea vuelos llenos, con equipaje para uno de cada tres pasajeros, y su almacén columnar"""
+    companias = [Compania(f"C{i}", f"Compañía {i}", "Uruguay") for i in range(8)]
+    pasajero = Cliente("1", "Apellido", "Nombre", "correo@ejemplo.com", "099000000", "Uruguay")
+    almacen = AlmacenColumnar()
+    lista = []
+    fecha = datetime(2030, 1, 1)
+    for i in range(vuelos):
+        origen = CIUDADES[i % len(CIUDADES)]
+        destino = CIUDADES[(i // len(CIUDADES) + i + 1) % len(CIUDADES)]
+        vuelo = Vuelo(f"V{i:06d}", origen, destino, 2, fecha + timedelta(hours=i), companias[i % len(companias)],
+                      capacidad, "internacional")
+        almacen.agregar_vuelo(vuelo)
+        for numero in range(1, capacidad - i % 10 + 1):
+            ticket = Ticket(numero, pasajero, vuelo.codigo)
+            vuelo.agregar_ticket(ticket)
+            almacen.agregar_ticket(ticket)
+            if numero % 3 == 0:
+                peso = 10 + numero % 30
+                equipaje = Equipaje(f"{vuelo.codigo}-{numero}", pasajero, peso, Equipaje.calcular_costo(peso, True), True)
+                vuelo._equipajes[equipaje.codigo] = equipaje
+                almacen.agregar_equipaje(equipaje, vuelo.codigo)
+        if i % 50 == 0:
+            vuelo.cancelar()
+            almacen.cancelar_vuelo(vuelo)
+        lista.append(vuelo)
+    return lista, almacen
+
+def recorriendo_vuelos(vuelos):
+    """Los dos agregados calculados recorriendo los vuelos, como antes"""
+    ocupaciones = {}
+    ingresos = {}
+    for vuelo in vuelos:
+        if vuelo.estado != "activo":
+            continue
+        ocupaciones.setdefault((vuelo.origen, vuelo.destino), []).append(len(vuelo.tickets) / vuelo.capacidad_asientos)
+        for equipaje in vuelo.equipajes:
+            if equipaje.costo > 0:
+                clave = (vuelo.compania.codigo, vuelo.fecha.strftime("%Y-%m"))
+                ingresos[clave] = ingresos.get(clave, 0) + equipaje.costo
+    return {ruta: sum(valores) / len(valores) for ruta, valores in ocupaciones.items()}, ingresos
+
+def medir(nombre, calcular, repeticiones=3):
+    """Mide el tiempo promedio de calcular() y retorna su resultado"""
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = calcular()
+    print(f"{nombre:<22} {(time.perf_counter() - inicio) / repeticiones * 1000:>10.1f} ms")
+    return resultado
+
+def main(vuelos=10_000, capacidad=200):
+    """Compara los agregados recorriendo los vuelos y con el almacén columnar, con y sin NumPy"""
+    lista, almacen = poblar(vuelos, capacidad)
+    print(f"{vuelos} vuelos, {len(almacen)} tickets, {len(almacen.equipaje_activo)} equipajes")
+    
+    def columnar():
+        return almacen.ocupacion_por_ruta(), almacen.ingresos_equipaje_por_compania_y_mes()
+    
+    esperado = medir("recorriendo vuelos", lambda: recorriendo_vuelos(lista))
+    numpy = almacen_columnar.np
+    if numpy is not None:
+        resultado = medir("columnas con NumPy", columnar)
+        if resultado[1] != esperado[1] or any(abs(resultado[0][r] - esperado[0][r]) > 1e-9 for r in esperado[0]):
+            print("FALLA: los agregados con NumPy no coinciden")
+    else:
+        print("NumPy no está instalado")
+    almacen_columnar.np = None
+    try:
+        resultado = medir("columnas sin NumPy", columnar)
+    finally:
+        almacen_columnar.np = numpy
+    if resultado[1] != esperado[1] or any(abs(resultado[0][r] - esperado[0][r]) > 1e-9 for r in esperado[0]):
+        print("FALLA: los agregados sin NumPy no coinciden")
+
+if __name__ == "__main__":
+    main(*(int(argumento) for argumento in sys.argv[1:]))
@@ -0,0 +1,160 @@
+import random
+import sys
+import threading
+from datetime import datetime, timedelta
+from Sistema import Sistema
+from Excepciones import (EntidadNoEncontradaException, EntidadDuplicadaException, DatoInvalidoException,
+                         VueloCompletoException, EquipajeInvalidoException, ConflictoTripulacionException)
+
+# Errores esperables cuando varios hilos compiten por los mismos vuelos
+ERRORES_ESPERADOS = (EntidadNoEncontradaException, EntidadDuplicadaException, DatoInvalidoException,
+                     VueloCompletoException, EquipajeInvalidoException, ConflictoTripulacionException)
+
+def poblar(sistema, vuelos, clientes, tripulantes, capacidad):
+    """Carga compañías, personas y vuelos de prueba. Retorna los códigos de vuelo y los documentos"""
+    sistema.registrar_compania("EST", "Estrés", "Uruguay")
+    documentos_clientes = [f"C{i}" for i in range(clientes)]
+    for documento in documentos_clientes:
+        sistema.registrar_persona("cliente", documento, "Prueba", "Cliente", "c@prueba.com", "099", nacionalidad="Uruguay")
+    documentos_tripulantes = [f"T{i}" for i in range(tripulantes)]
+    roles = ["piloto", "copiloto", "azafata"]
+    for i, documento in enumerate(documentos_tripulantes):
+        sistema.registrar_persona("tripulante", documento, "Prueba", "Tripulante", "t@prueba.com", "099",
+                                  rol=roles[i % 3], fecha_ingreso_compania=datetime(2020, 1, 1), horas_vuelo=100)
+    fecha = datetime(2030, 1, 1)
+    codigos = [sistema.crear_vuelo("Montevideo", "Buenos Aires", 1, fecha + timedelta(hours=6 * i), "EST", capacidad, "nacional").codigo
+               for i in range(vuelos)]
+    return codigos, documentos_clientes, documentos_tripulantes
+
+def trabajar(sistema, codigos, clientes, tripulantes, operaciones, semilla, errores):
+    """Ejecuta operaciones al azar sobre el sistema"""
+    azar = random.Random(semilla)
+    for _ in range(operaciones):
+        codigo = azar.choice(codigos)
+        tirada = azar.random()
+        try:
+            if tirada < 0.35:
+                sistema.crear_ticket(codigo, azar.choice(clientes))
+            elif tirada < 0.45:
+                # Reservas cortas: algunas se confirman y otras vencen
+                reserva = sistema.reservar_asiento(codigo, azar.choice(clientes), duracion=0.001)
+                if azar.random() < 0.5:
+                    sistema.confirmar_reserva(codigo, reserva.codigo, ahora=reserva.creada)
+                else:
+                    sistema.liberar_reservas_vencidas()
+            elif tirada < 0.65:
+                vuelo = sistema._buscar_vuelo_por_codigo(codigo)
+                tickets = list(vuelo.tickets)
+                if tickets:
+                    sistema.cancelar_ticket(codigo, azar.choice(tickets).numero)
+            elif tirada < 0.85:
+                sistema.registrar_equipaje(codigo, azar.randint(1, 40), azar.choice([5, 15, 22, 30]))
+            elif tirada < 0.9995:
+                sistema.asignar_personal_vuelo(codigo, azar.choice(tripulantes))
+            elif azar.random() < 0.5:
+                sistema.cancelar_vuelo(codigo, azar.choice(codigos), "estrés")
+            else:
+                sistema.cancelar_vuelo_por_ruta(codigo, "estrés")
+        except ERRORES_ESPERADOS:
+            pass
+        except Exception as e:
+            errores.append(e)
+
+def verificar_invariantes(sistema):
+    """Retorna la lista de invariantes que no se cumplen"""
+    fallas = []
+    vendidos = {(t.codigo_vuelo, t.numero) for t in sistema.tickets_vendidos}
+    en_vuelos = set()
+    # Los vuelos cancelados conservan sus tickets para los informes, fuera del libro de vendidos
+    for vuelo in sistema.obtener_vuelos_activos():
+        tickets = list(vuelo.tickets)
+        if len(tickets) > vuelo.capacidad_asientos:
+            fallas.append(f"{vuelo.codigo}: {len(tickets)} tickets para {vuelo.capacidad_asientos} asientos")
+        if len(tickets) != len(vuelo._tickets_por_documento):
+            fallas.append(f"{vuelo.codigo}: índice por documento desalineado")
+        if len({t.pasajero.documento for t in tickets}) != len(tickets):
+            fallas.append(f"{vuelo.codigo}: pasajero con más de un ticket")
+        numeros = [t.numero for t in tickets]
+        if len(set(numeros)) != len(numeros):
+            fallas.append(f"{vuelo.codigo}: números de ticket repetidos")
+        reservas = list(vuelo.reservas)
+        asientos = {t.asiento for t in tickets} | {r.asiento for r in reservas}
+        if len(asientos) != len(tickets) + len(reservas) or vuelo.asientos.libres != vuelo.capacidad_asientos - len(asientos):
+            fallas.append(f"{vuelo.codigo}: mapa de asientos desalineado")
+        documentos = {t.pasajero.documento for t in tickets}
+        for equipaje in vuelo.equipajes:
+            if equipaje.pasajero.documento not in documentos:
+                fallas.append(f"{vuelo.codigo}: equipaje {equipaje.codigo} sin ticket")
+        if sum(1 for _ in vuelo.equipajes) != sum(vuelo.cantidad_equipaje(d) for d in documentos):
+            fallas.append(f"{vuelo.codigo}: cantidad de equipaje desalineada")
+        en_vuelos.update((t.codigo_vuelo, t.numero) for t in tickets)
+    
+    # La agenda de cada tripulante tiene exactamente sus vuelos activos, sin superposiciones ni descanso corto
+    descanso = timedelta(hours=sistema.DESCANSO_MINIMO_HORAS)
+    for tripulante in sistema.obtener_tripulantes():
+        agenda = tripulante._agenda
+        vuelos = sorted((v.fecha, v.obtener_fecha_llegada(), v.codigo) for v in sistema.obtener_vuelos_activos()
+                        for tripulantes in v.tripulacion.values() if tripulante in tripulantes)
+        if agenda != vuelos:
+            fallas.append(f"{tripulante.documento}: agenda desalineada con sus vuelos")
+        if any(anterior[1] + descanso > siguiente[0] for anterior, siguiente in zip(agenda, agenda[1:])):
+            fallas.append(f"{tripulante.documento}: vuelos superpuestos o sin descanso")
+    if vendidos != en_vuelos:
+        fallas.append(f"libro de tickets desalineado: {len(vendidos)} vendidos, {len(en_vuelos)} en vuelos")
+    
+    # Los contadores de cada compañía coinciden con sus vuelos
+    for compania in sistema.companias:
+        vuelos = [v for v in sistema.vuelos if v.compania is compania]
+        cancelados = sum(1 for v in vuelos if v.estado == "cancelado")
+        if (list(compania.vuelos) != vuelos or compania.cantidad_cancelados() != cancelados
+                or compania.cantidad_activos() != len(vuelos) - cancelados):
+            fallas.append(f"{compania.codigo}: contadores de vuelos desalineados")
+    
+    # Los agregados del almacén columnar coinciden con los que se calculan recorriendo los vuelos
+    ocupaciones = {}
+    ingresos = {}
+    for vuelo in sistema.obtener_vuelos_activos():
+        ocupaciones.setdefault((vuelo.origen, vuelo.destino), []).append(len(vuelo.tickets) / vuelo.capacidad_asientos)
+        for equipaje in vuelo.equipajes:
+            if equipaje.costo > 0:
+                clave = (vuelo.compania.codigo, vuelo.fecha.strftime("%Y-%m"))
+                ingresos[clave] = ingresos.get(clave, 0) + equipaje.costo
+    ocupacion = sistema.analitica.ocupacion_por_ruta()
+    if ocupacion.keys() != ocupaciones.keys() or any(abs(ocupacion[ruta] - sum(valores) / len(valores)) > 1e-9
+                                                     for ruta, valores in ocupaciones.items()):
+        fallas.append("ocupación por ruta del almacén columnar desalineada")
+    if sistema.analitica.ingresos_equipaje_por_compania_y_mes() != ingresos:
+        fallas.append("ingresos por equipaje del almacén columnar desalineados")
+    return fallas
+
+def main(hilos=16, operaciones=5000, vuelos=24, clientes=60, tripulantes=30, capacidad=40):
+    """Corre la prueba de estrés y muestra el resultado"""
+    sistema = Sistema()
+    codigos, documentos_clientes, documentos_tripulantes = poblar(sistema, vuelos, clientes, tripulantes, capacidad)
+    
+    # Cambiar de hilo muy seguido para provocar intercalados
+    intervalo = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    errores = []
+    try:
+        trabajadores = [threading.Thread(target=trabajar, args=(sistema, codigos, documentos_clientes,
+                                                                documentos_tripulantes, operaciones, i, errores))
+                        for i in range(hilos)]
+        for trabajador in trabajadores:
+            trabajador.start()
+        for trabajador in trabajadores:
+            trabajador.join()
+    finally:
+        sys.setswitchinterval(intervalo)
+    
+    fallas = [f"error inesperado: {e!r}" for e in errores] + verificar_invariantes(sistema)
+    print(f"Hilos: {hilos} - Operaciones: {hilos * operaciones} - "
+          f"Tickets vendidos: {len(sistema.tickets_vendidos)} - Cancelados: {len(sistema.tickets_cancelados)} - "
+          f"Vuelos activos: {len(sistema.obtener_vuelos_activos())}/{len(sistema.vuelos)}")
+    for falla in fallas:
+        print(f"FALLA: {falla}")
+    print("OK" if not fallas else f"{len(fallas)} fallas")
+    return not fallas
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
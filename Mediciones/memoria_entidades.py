@@ -0,0 +1,67 @@
+import gc
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from Entidades.cliente import Cliente
+from Entidades.ticket import Ticket
+
+class _ClienteConDict:
+    """Cliente como era antes de __slots__: atributos en un __dict__ por instancia"""
+    
+    def __init__(self, documento, apellido, nombre, email, celular, nacionalidad):
+        self.documento = documento
+        self.apellido = apellido
+        self.nombre = nombre
+        self.email = email
+        self.celular = celular
+        self.nacionalidad = nacionalidad
+        self.fecha_ingreso = datetime.now()
+        self.historial_vuelos = []
+
+class _TicketConDict:
+    """Ticket como era antes de __slots__"""
+    
+    def __init__(self, numero, pasajero, codigo_vuelo, asiento=None):
+        self.numero = numero
+        self.pasajero = pasajero
+        self.codigo_vuelo = codigo_vuelo
+        self.asiento = asiento
+
+def construir(clase_cliente, clase_ticket, tickets, clientes):
+    """Crea los clientes y los tickets (varios por cliente) y los retorna"""
+    personas = [clase_cliente(f"{i:08d}", "Apellido", "Nombre", "correo@ejemplo.com", "099000000", "Uruguay")
+                for i in range(clientes)]
+    codigos_vuelo = [f"AER{n:05d}" for n in range(tickets // 300 + 1)]  # Los tickets de un vuelo comparten el código
+    vendidos = [clase_ticket(i % 300 + 1, personas[i % clientes], codigos_vuelo[i // 300], i % 300 + 1)
+                for i in range(tickets)]
+    return personas, vendidos
+
+def medir(nombre, clase_cliente, clase_ticket, tickets, clientes):
+    """Mide memoria, tiempo de construcción y una pasada completa del GC"""
+    gc.collect()
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    datos = construir(clase_cliente, clase_ticket, tickets, clientes)
+    construccion = time.perf_counter() - inicio
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    
+    inicio = time.perf_counter()
+    gc.collect()
+    pausa_gc = time.perf_counter() - inicio
+    del datos
+    print(f"{nombre:<12} {memoria / 2**20:>10.1f} MiB {memoria / (tickets + clientes):>10.0f} B/objeto "
+          f"{construccion:>8.2f} s {pausa_gc * 1000:>10.1f} ms")
+    return memoria
+
+def main(tickets=1_000_000, clientes=250_000):
+    """Compara la memoria de clientes y tickets con __dict__ (antes) y con __slots__ (ahora)"""
+    print(f"{tickets} tickets, {clientes} clientes")
+    print(f"{'':<12} {'memoria':>14} {'promedio':>19} {'armado':>10} {'gc.collect()':>13}")
+    antes = medir("con __dict__", _ClienteConDict, _TicketConDict, tickets, clientes)
+    ahora = medir("con __slots__", Cliente, Ticket, tickets, clientes)
+    print(f"Ahorro: {(1 - ahora / antes) * 100:.0f}%")
+
+if __name__ == "__main__":
+    main(*(int(argumento) for argumento in sys.argv[1:]))
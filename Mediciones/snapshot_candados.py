@@ -0,0 +1,38 @@
+import os
+import sys
+import tempfile
+import time
+from Persistencia.sistema_persistente import SistemaPersistente
+from Mediciones.valores_compartidos import poblar
+
+def medir(vuelos, clientes):
+    """Mide cuánto tiempo quedan tomados los candados al guardar un snapshot y cuánto sigue en segundo plano"""
+    with tempfile.TemporaryDirectory() as directorio:
+        sistema = SistemaPersistente(directorio, snapshot_cada=0)
+        poblar(sistema, vuelos, clientes)
+        
+        inicio = time.perf_counter()
+        sistema.guardar_snapshot()
+        bloqueo = time.perf_counter() - inicio
+        
+        inicio = time.perf_counter()
+        sistema.registrar_compania("OTR", "Otra", "Uruguay")
+        operacion = time.perf_counter() - inicio
+        
+        inicio = time.perf_counter()
+        sistema.cerrar()
+        fondo = time.perf_counter() - inicio
+        tamano = os.path.getsize(os.path.join(directorio, SistemaPersistente.ARCHIVO_SNAPSHOT))
+    
+    print(f"{vuelos} vuelos, {clientes} clientes - snapshot de {tamano / 2**20:.1f} MiB "
+          f"({'proceso hijo' if hasattr(os, 'fork') else 'hilo'})")
+    print(f"Candados tomados: {bloqueo * 1000:.0f} ms - Operación siguiente: {operacion * 1000:.1f} ms - "
+          f"En segundo plano: {fondo * 1000:.0f} ms")
+    return bloqueo
+
+def main(vuelos=20_000, clientes=200_000):
+    """Mide el costo de un snapshot para las operaciones que llegan mientras se guarda"""
+    medir(vuelos, clientes)
+
+if __name__ == "__main__":
+    main(*(int(argumento) for argumento in sys.argv[1:]))
@@ -0,0 +1,61 @@
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from Sistema import Sistema
+
+CIUDADES = ["Montevideo", "Buenos Aires", "Asunción", "São Paulo", "Santiago", "Lima", "Bogotá", "Punta del Este"]
+PAISES = ["Uruguay", "Argentina", "Paraguay", "Brasil", "Chile", "Perú", "Colombia"]
+
+def leido(texto):
+    """Copia nueva de un texto, como la que produce leer un archivo o un pedido"""
+    return texto.encode("utf-8").decode("utf-8")
+
+def poblar(sistema, vuelos, clientes):
+    """Registra clientes y vuelos con textos leídos uno por uno"""
+    sistema.registrar_compania("AER", "Aerolíneas", leido("Uruguay"))
+    for i in range(clientes):
+        sistema.registrar_persona("cliente", f"{i:08d}", "Apellido", "Nombre", "correo@ejemplo.com", "099000000",
+                                  nacionalidad=leido(PAISES[i % len(PAISES)]))
+    for i in range(vuelos):
+        origen = CIUDADES[i % len(CIUDADES)]
+        destino = CIUDADES[(i * 3 + 1) % len(CIUDADES)]
+        sistema.crear_vuelo(leido(origen), leido(destino), 2, datetime(2030, 1, 1) + timedelta(minutes=i), "AER", 100,
+                            leido("Nacional"))
+
+def medir(nombre, sistema, vuelos, clientes):
+    """Mide la memoria de los textos repetidos y el tiempo de comparar rutas y nacionalidades"""
+    tracemalloc.start()
+    poblar(sistema, vuelos, clientes)
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    
+    origen = sistema._valores.get("Montevideo", leido("Montevideo"))
+    destino = sistema._valores.get("Buenos Aires", leido("Buenos Aires"))
+    pais = sistema._valores.get("Uruguay", leido("Uruguay"))
+    comparar = ((lambda a, b: a is b) if sistema._valores else (lambda a, b: a == b))
+    inicio = time.perf_counter()
+    for _ in range(5):
+        rutas = sum(1 for v in sistema.vuelos if comparar(v.origen, origen) and comparar(v.destino, destino))
+        uruguayos = sum(1 for c in sistema.personas if comparar(c.nacionalidad, pais))
+    comparacion = (time.perf_counter() - inicio) / 5
+    print(f"{nombre:<18} {memoria / 2**20:>9.1f} MiB {comparacion * 1000:>9.1f} ms  ({rutas} vuelos, {uruguayos} clientes)")
+    return memoria, comparacion
+
+class _SistemaSinCompartir(Sistema):
+    """Sistema sin registro de valores compartidos, como era antes"""
+    
+    def _compartir(self, valor):
+        return valor
+
+def main(vuelos=100_000, clientes=300_000):
+    """Compara memoria y comparaciones con y sin valores compartidos"""
+    print(f"{vuelos} vuelos, {clientes} clientes")
+    print(f"{'':<18} {'memoria':>13} {'comparar':>12}")
+    memoria_antes, comparacion_antes = medir("textos repetidos", _SistemaSinCompartir(), vuelos, clientes)
+    memoria_ahora, comparacion_ahora = medir("valores compartidos", Sistema(), vuelos, clientes)
+    print(f"Memoria: -{(memoria_antes - memoria_ahora) / 2**20:.1f} MiB ({(1 - memoria_ahora / memoria_antes) * 100:.0f}%) - "
+          f"Comparaciones: {comparacion_antes / comparacion_ahora:.1f}x más rápidas")
+
+if __name__ == "__main__":
+    main(*(int(argumento) for argumento in sys.argv[1:]))
@@ -0,0 +1,8 @@
+# Archivo __init__.py para el paquete persistencia
+# Este archivo permite importar las clases del paquete
+
+from .journal import Journal
+from .snapshot import Snapshot
+from .sistema_persistente import SistemaPersistente, DIRECTORIO_DATOS
+
+__all__ = ['Journal', 'Snapshot', 'SistemaPersistente', 'DIRECTORIO_DATOS']
@@ -0,0 +1,93 @@
+import json
+import os
+import time
+from datetime import datetime
+
+def _codificar(valor):
+    """Convierte a JSON los valores que json no soporta directamente"""
+    if isinstance(valor, datetime):
+        return {"$fecha": valor.isoformat()}
+    raise TypeError(f"No se puede guardar un valor de tipo {type(valor).__name__}")
+
+def _decodificar(objeto):
+    """Reconstruye los valores codificados por _codificar"""
+    if len(objeto) == 1 and "$fecha" in objeto:
+        return datetime.fromisoformat(objeto["$fecha"])
+    return objeto
+
+class Journal:
+    """Registro de operaciones de solo agregado, una operación JSON por línea.
+    
+    Cada registro se escribe y se vacía al sistema operativo en el momento,
+    pero el fsync a disco se hace por lotes: cada `fsync_cada` registros o
+    cuando pasaron `intervalo_fsync` segundos desde el último.
+    """
+    
+    def __init__(self, ruta, fsync_cada=32, intervalo_fsync=1.0):
+        self.ruta = ruta
+        self.fsync_cada = fsync_cada
+        self.intervalo_fsync = intervalo_fsync
+        self._recortar_linea_incompleta(ruta)
+        self._archivo = open(ruta, "a", encoding="utf-8")
+        self._pendientes = 0
+        self._ultimo_fsync = time.monotonic()
+    
+    def escribir(self, registro):
+        """Agrega un registro al final del journal"""
+        self._archivo.write(json.dumps(registro, default=_codificar, ensure_ascii=False) + "\n")
+        self._archivo.flush()
+        self._pendientes += 1
+        if (self._pendientes >= self.fsync_cada or
+                time.monotonic() - self._ultimo_fsync >= self.intervalo_fsync):
+            self.sincronizar()
+    
+    def sincronizar(self):
+        """Fuerza a disco los registros pendientes"""
+        if self._pendientes:
+            self._archivo.flush()
+            os.fsync(self._archivo.fileno())
+            self._pendientes = 0
+        self._ultimo_fsync = time.monotonic()
+    
+    def cerrar(self):
+        """Sincroniza y cierra el journal"""
+        if not self._archivo.closed:
+            self.sincronizar()
+            self._archivo.close()
+    
+    @staticmethod
+    def _recortar_linea_incompleta(ruta, bloque=65536):
+        """Corta el archivo al final de su última línea completa.
+        
+        Así un registro que quedó a medias por una escritura interrumpida
+        no se pega con el siguiente que se agregue.
+        """
+        if not os.path.exists(ruta):
+            return
+        with open(ruta, "r+b") as archivo:
+            fin = archivo.seek(0, os.SEEK_END)
+            posicion = fin
+            while posicion > 0:
+                inicio = max(0, posicion - bloque)
+                archivo.seek(inicio)
+                salto = archivo.read(posicion - inicio).rfind(b"\n")
+                if salto != -1:
+                    posicion = inicio + salto + 1
+                    break
+                posicion = inicio
+            if posicion < fin:
+                archivo.truncate(posicion)
+    
+    @staticmethod
+    def leer(ruta):
+        """Recorre los registros de un journal en orden.
+        
+        Una última línea incompleta (escritura interrumpida) se ignora.
+        """
+        if not os.path.exists(ruta):
+            return
+        with open(ruta, encoding="utf-8") as archivo:
+            for linea in archivo:
+                if not linea.endswith("\n"):
+                    break
+                yield json.loads(linea, object_hook=_decodificar)
@@ -0,0 +1,216 @@
+import glob
+import os
+import threading
+from Sistema import Sistema
+from Persistencia.journal import Journal
+from Persistencia.snapshot import Snapshot
+
+# Directorio donde se guardan por defecto los datos del sistema entre ejecuciones
+DIRECTORIO_DATOS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "datos")
+
+class SistemaPersistente(Sistema):
+    """Sistema que guarda en un journal cada operación que lo modifica.
+    
+    Al crearse carga el último snapshot del directorio indicado y reproduce
+    solo los registros del journal posteriores a él. Un snapshot de otra
+    versión se ignora si el journal todavía tiene todas las operaciones desde
+    la primera (el estado se reconstruye desde él); si no, no se puede
+    cargar el directorio y se lanza ValueError. Solo se registran las
+    operaciones que terminaron sin error; se registran desde el hook
+    _notificar de Sistema, con los candados de la operación tomados, así que
+    el orden del journal respeta el de las operaciones que se pisan entre sí.
+    
+    Cada `snapshot_cada` operaciones se toma un snapshot nuevo: el journal
+    actual se cierra como tramo y se empieza otro. El snapshot se serializa
+    y escribe en segundo plano y recién entonces se borran los tramos que cubre.
+    Si el anterior todavía se está escribiendo, el nuevo espera a que termine
+    en lugar de frenar a las operaciones.
+    """
+    
+    ARCHIVO_JOURNAL = "journal.log"
+    ARCHIVO_SNAPSHOT = "snapshot.bin"
+    
+    # Atributos propios de la persistencia, que no forman parte del snapshot
+    _ATRIBUTOS_PERSISTENCIA = ("_directorio", "_secuencia", "_journal", "_fsync_cada", "_intervalo_fsync",
+                               "_snapshot_cada", "_secuencia_snapshot", "_hilo_snapshot",
+                               "_candado_journal", "_snapshot_pendiente")
+    
+    def __init__(self, directorio, fsync_cada=32, intervalo_fsync=1.0, snapshot_cada=1000):
+        super().__init__()
+        os.makedirs(directorio, exist_ok=True)
+        self._directorio = directorio
+        self._fsync_cada = fsync_cada
+        self._intervalo_fsync = intervalo_fsync
+        self._snapshot_cada = snapshot_cada
+        self._hilo_snapshot = None
+        self._candado_journal = threading.Lock()
+        self._snapshot_pendiente = False
+        self._journal = None  # Sin journal no se registra nada mientras se reproduce
+        self._secuencia = 0
+        
+        snapshot = None
+        ruta_snapshot = self._ruta(self.ARCHIVO_SNAPSHOT)
+        version = Snapshot.version(ruta_snapshot)
+        if version is not None and version != Snapshot.VERSION:
+            if not self._journal_completo():
+                raise ValueError(f"El snapshot {ruta_snapshot} es de la versión {version}, incompatible con la "
+                                 f"{Snapshot.VERSION}, y el journal ya no tiene las operaciones que cubre: "
+                                 f"no se pueden cargar los datos de {directorio}")
+        else:
+            snapshot = Snapshot.leer(ruta_snapshot)
+        if snapshot:
+            self._secuencia, estado = snapshot
+            vars(self).update(estado)
+        self._secuencia_snapshot = self._secuencia
+        
+        for ruta in self._tramos_journal() + [self._ruta(self.ARCHIVO_JOURNAL)]:
+            for registro in Journal.leer(ruta):
+                if registro["seq"] > self._secuencia:
+                    self._reproducir(registro)
+        self._journal = Journal(self._ruta(self.ARCHIVO_JOURNAL), fsync_cada, intervalo_fsync)
+    
+    def guardar_snapshot(self, en_segundo_plano=True):
+        """Toma un snapshot del estado actual.
+        
+        El estado se fija con todos los candados tomados para que sea
+        consistente. En segundo plano, donde hay os.fork, un proceso hijo
+        recibe una copia del estado (las páginas se copian recién cuando el
+        padre las modifica) y lo serializa y escribe sin frenar a las
+        operaciones: los candados quedan tomados solo lo que tarda el fork.
+        Sin fork (Windows) el estado se serializa con los candados tomados y
+        solo la escritura a disco va en un hilo aparte.
+        """
+        with self._bloquear(registro=True, todos_los_vuelos=True), self._candado_journal:
+            self._snapshot_pendiente = False
+            self._esperar_snapshot()
+            if self._secuencia == self._secuencia_snapshot and os.path.exists(self._ruta(self.ARCHIVO_SNAPSHOT)):
+                return
+            estado = {k: v for k, v in self.__getstate__().items() if k not in self._ATRIBUTOS_PERSISTENCIA}
+            secuencia = self._secuencia
+            
+            # El journal actual pasa a ser un tramo cubierto por este snapshot
+            self._journal.cerrar()
+            ruta_journal = self._ruta(self.ARCHIVO_JOURNAL)
+            if os.path.exists(ruta_journal):
+                os.replace(ruta_journal, self._ruta(f"journal-{secuencia:012d}.log"))
+            self._journal = Journal(ruta_journal, self._fsync_cada, self._intervalo_fsync)
+            self._secuencia_snapshot = secuencia
+            
+            if en_segundo_plano and hasattr(os, "fork"):
+                pid = os.fork()
+                if pid == 0:
+                    self._escribir_snapshot_en_hijo(secuencia, estado)
+                self._hilo_snapshot = threading.Thread(target=self._esperar_hijo, args=(pid, secuencia), daemon=True)
+                self._hilo_snapshot.start()
+            elif en_segundo_plano:
+                datos = Snapshot.serializar(secuencia, estado)
+                self._hilo_snapshot = threading.Thread(target=self._escribir_snapshot, args=(secuencia, datos), daemon=True)
+                self._hilo_snapshot.start()
+            else:
+                self._escribir_snapshot(secuencia, Snapshot.serializar(secuencia, estado))
+    
+    def cerrar(self):
+        """Espera el snapshot en curso y cierra el journal"""
+        with self._candado_journal:
+            self._esperar_snapshot()
+            self._journal.cerrar()
+    
+    # ========== MÉTODOS AUXILIARES ==========
+    
+    def _notificar(self, operacion, **argumentos):
+        """Guarda en el journal una operación que terminó sin error"""
+        if self._journal is None:
+            return
+        
+        # Datos que dependen del momento en que se hizo la operación
+        extra = {}
+        if operacion == "registrar_persona":
+            persona = self._buscar_persona_por_documento(argumentos["documento"])
+            if persona.obtener_tipo() == "Cliente":
+                extra["fecha_ingreso"] = persona.fecha_ingreso
+        elif operacion in ("cancelar_vuelo", "cancelar_vuelo_por_ruta"):
+            extra["fecha_cancelacion"] = self._buscar_vuelo_por_codigo(argumentos["codigo_vuelo"]).fecha_cancelacion
+        
+        with self._candado_journal:
+            self._registrar(operacion, argumentos, extra)
+    
+    def _al_liberar_candados(self):
+        """Toma el snapshot pendiente, si lo hay, cuando el hilo ya no tiene candados"""
+        if self._snapshot_pendiente and not (self._hilo_snapshot and self._hilo_snapshot.is_alive()):
+            self.guardar_snapshot()
+    
+    def _registrar(self, operacion, argumentos, extra=None):
+        """Escribe una operación en el journal y marca si corresponde un snapshot"""
+        self._secuencia += 1
+        registro = {"seq": self._secuencia, "op": operacion, "args": argumentos}
+        if extra:
+            registro["extra"] = extra
+        self._journal.escribir(registro)
+        if self._snapshot_cada and self._secuencia - self._secuencia_snapshot >= self._snapshot_cada:
+            self._snapshot_pendiente = True
+    
+    def _ruta(self, nombre):
+        """Ruta de un archivo dentro del directorio de datos"""
+        return os.path.join(self._directorio, nombre)
+    
+    def _tramos_journal(self):
+        """Tramos de journal cerrados, ordenados por su último registro"""
+        return sorted(glob.glob(self._ruta("journal-*.log")))
+    
+    def _journal_completo(self):
+        """True si el journal (tramos y actual) empieza en la primera operación"""
+        for ruta in self._tramos_journal() + [self._ruta(self.ARCHIVO_JOURNAL)]:
+            for registro in Journal.leer(ruta):
+                return registro["seq"] == 1
+        return False
+    
+    def _escribir_snapshot(self, secuencia, datos):
+        """Guarda el snapshot y borra los tramos de journal que ya cubre"""
+        Snapshot.escribir(self._ruta(self.ARCHIVO_SNAPSHOT), datos)
+        self._borrar_tramos(secuencia)
+    
+    def _escribir_snapshot_en_hijo(self, secuencia, estado):
+        """En el proceso hijo del fork: guarda el snapshot y termina sin volver al código del padre"""
+        codigo = 1
+        try:
+            Snapshot.escribir(self._ruta(self.ARCHIVO_SNAPSHOT), Snapshot.serializar(secuencia, estado))
+            codigo = 0
+        finally:
+            os._exit(codigo)
+    
+    def _esperar_hijo(self, pid, secuencia):
+        """Espera al proceso que escribe el snapshot y, si terminó bien, borra los tramos que cubre"""
+        _, estado = os.waitpid(pid, 0)
+        if os.waitstatus_to_exitcode(estado) != 0:
+            raise OSError(f"No se pudo guardar el snapshot de la secuencia {secuencia}")
+        self._borrar_tramos(secuencia)
+    
+    def _borrar_tramos(self, secuencia):
+        """Borra los tramos de journal que ya cubre el snapshot de la secuencia indicada"""
+        for ruta in self._tramos_journal():
+            fin_tramo = int(os.path.basename(ruta)[len("journal-"):-len(".log")])
+            if fin_tramo <= secuencia:
+                os.remove(ruta)
+    
+    def _esperar_snapshot(self):
+        """Espera a que termine de escribirse el snapshot en curso, si lo hay"""
+        if self._hilo_snapshot is not None:
+            self._hilo_snapshot.join()
+            self._hilo_snapshot = None
+    
+    def _reproducir(self, registro):
+        """Aplica una operación leída del journal sin volver a registrarla"""
+        operacion = registro["op"]
+        argumentos = registro["args"]
+        extra = registro.get("extra", {})
+        if operacion == "crear_ticket" and "ahora" not in argumentos:
+            # Registro anterior a que crear_ticket liberara reservas vencidas: no libera ninguna
+            argumentos = {**argumentos, "ahora": float("-inf")}
+        resultado = getattr(self, operacion)(**argumentos)
+        
+        # Restaurar los datos que dependen del momento en que se hizo la operación
+        if "fecha_ingreso" in extra:
+            resultado.fecha_ingreso = extra["fecha_ingreso"]
+        if "fecha_cancelacion" in extra:
+            self._buscar_vuelo_por_codigo(argumentos["codigo_vuelo"]).fecha_cancelacion = extra["fecha_cancelacion"]
+        self._secuencia = registro["seq"]
@@ -0,0 +1,54 @@
+import os
+import pickle
+
+class Snapshot:
+    """Foto binaria (pickle) del estado completo del sistema.
+    
+    Se escribe en un archivo temporal que reemplaza al anterior solo cuando
+    quedó completo en disco, así siempre hay un snapshot válido.
+    """
+    
+    # La versión cambia cada vez que cambia la forma en que se guardan las entidades
+    # (por ejemplo al pasar a __slots__): un snapshot de otra versión no se puede cargar
+    PREFIJO = b"AEROSNAP"
+    VERSION = 2
+    ENCABEZADO = PREFIJO + str(VERSION).encode() + b"\n"
+    
+    @staticmethod
+    def serializar(secuencia, estado):
+        """Convierte el estado a bytes, junto con la secuencia del último registro que incluye"""
+        return Snapshot.ENCABEZADO + pickle.dumps((secuencia, estado), protocol=pickle.HIGHEST_PROTOCOL)
+    
+    @staticmethod
+    def escribir(ruta, datos):
+        """Guarda en disco un snapshot ya serializado"""
+        temporal = ruta + ".tmp"
+        with open(temporal, "wb") as archivo:
+            archivo.write(datos)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, ruta)
+    
+    @staticmethod
+    def version(ruta):
+        """Retorna la versión del snapshot guardado, o None si no existe"""
+        if not os.path.exists(ruta):
+            return None
+        with open(ruta, "rb") as archivo:
+            encabezado = archivo.readline()
+        if not encabezado.startswith(Snapshot.PREFIJO) or not encabezado[len(Snapshot.PREFIJO):].strip().isdigit():
+            raise ValueError(f"El archivo {ruta} no es un snapshot válido")
+        return int(encabezado[len(Snapshot.PREFIJO):])
+    
+    @staticmethod
+    def leer(ruta):
+        """Retorna (secuencia, estado) del snapshot, o None si no existe"""
+        version = Snapshot.version(ruta)
+        if version is None:
+            return None
+        if version != Snapshot.VERSION:
+            raise ValueError(f"El snapshot {ruta} es de la versión {version} y esta versión del sistema "
+                             f"solo lee la {Snapshot.VERSION}")
+        with open(ruta, "rb") as archivo:
+            datos = archivo.read()
+        return pickle.loads(datos[len(Snapshot.ENCABEZADO):])
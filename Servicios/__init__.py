@@ -0,0 +1,12 @@
+# Archivo __init__.py para el paquete servicios
+# Este archivo permite importar las funciones del paquete
+
+from .importacion import importar_archivo, importar_filas, ResultadoImportacion, TIPOS_REGISTRO
+from .exportacion import exportar, ENTIDADES_EXPORTABLES
+from .lotes import procesar_lote, ejecutar_operacion
+from .servidor import ServidorSistema, CandadoLectoresEscritor
+from .carga import generar_carga
+
+__all__ = ['importar_archivo', 'importar_filas', 'ResultadoImportacion', 'TIPOS_REGISTRO',
+           'exportar', 'ENTIDADES_EXPORTABLES', 'procesar_lote', 'ejecutar_operacion',
+           'ServidorSistema', 'CandadoLectoresEscritor', 'generar_carga']
@@ -0,0 +1,82 @@
+import asyncio
+import json
+import time
+
+async def _pedir(lector, escritor, metodo, ruta, argumentos=None):
+    """Hace un pedido HTTP por una conexión abierta y retorna (estado, respuesta JSON)"""
+    cuerpo = json.dumps(argumentos).encode("utf-8") if argumentos is not None else b""
+    escritor.write(f"{metodo} {ruta} HTTP/1.1\r\nHost: carga\r\nContent-Length: {len(cuerpo)}\r\n\r\n".encode("latin-1") + cuerpo)
+    await escritor.drain()
+    
+    estado = int((await lector.readline()).split()[1])
+    largo = 0
+    while True:
+        linea = await lector.readline()
+        if linea in (b"\r\n", b"\n", b""):
+            break
+        nombre, _, valor = linea.decode("latin-1").partition(":")
+        if nombre.strip().lower() == "content-length":
+            largo = int(valor)
+    return estado, json.loads(await lector.readexactly(largo))
+
+def _percentil(valores_ordenados, porcentaje):
+    """Percentil de una lista ya ordenada"""
+    indice = min(len(valores_ordenados) - 1, int(len(valores_ordenados) * porcentaje / 100))
+    return valores_ordenados[indice]
+
+async def generar_carga(host="127.0.0.1", puerto=8080, conexiones=16, pedidos=2000, proporcion_escrituras=0.2):
+    """Genera carga contra un ServidorSistema y mide latencia y rendimiento.
+    
+    Usa `conexiones` conexiones keep-alive en paralelo. Las escrituras
+    registran clientes nuevos y las lecturas piden el informe de personal
+    de un vuelo de prueba. Conviene usarlo contra un servidor con un
+    directorio de datos descartable, porque los datos de prueba quedan
+    guardados.
+    """
+    prefijo = f"CARGA{int(time.time() * 1000)}"
+    lector, escritor = await asyncio.open_connection(host, puerto)
+    await _pedir(lector, escritor, "POST", "/operaciones/registrar_compania",
+                 {"codigo": "CRG", "nombre": "Carga", "pais_origen": "Uruguay"})
+    estado, respuesta = await _pedir(lector, escritor, "POST", "/operaciones/crear_vuelo",
+                                     {"origen": "Montevideo", "destino": "Buenos Aires", "duracion_horas": 1,
+                                      "fecha": "01/01/2030 10:00", "codigo_compania": "CRG",
+                                      "capacidad_asientos": 100, "tipo_vuelo": "internacional"})
+    codigo_vuelo = respuesta["resultado"]["codigo"]
+    escritor.close()
+    
+    cada_escritura = max(1, round(1 / proporcion_escrituras)) if proporcion_escrituras > 0 else 0
+    siguiente = 0
+    latencias = []
+    errores = 0
+    
+    async def trabajador():
+        nonlocal siguiente, errores
+        lector, escritor = await asyncio.open_connection(host, puerto)
+        try:
+            while siguiente < pedidos:
+                numero = siguiente
+                siguiente += 1
+                inicio = time.perf_counter()
+                if cada_escritura and numero % cada_escritura == 0:
+                    estado, _ = await _pedir(lector, escritor, "POST", "/operaciones/registrar_persona",
+                                             {"tipo": "cliente", "documento": f"{prefijo}-{numero}", "apellido": "Carga",
+                                              "nombre": "Cliente", "email": "carga@prueba", "celular": "0",
+                                              "nacionalidad": "Uruguay"})
+                else:
+                    estado, _ = await _pedir(lector, escritor, "GET",
+                                             f"/operaciones/informe_personal_asignado?codigo_vuelo={codigo_vuelo}")
+                latencias.append(time.perf_counter() - inicio)
+                if estado != 200:
+                    errores += 1
+        finally:
+            escritor.close()
+    
+    inicio = time.perf_counter()
+    await asyncio.gather(*(trabajador() for _ in range(conexiones)))
+    duracion = time.perf_counter() - inicio
+    
+    latencias.sort()
+    return {"pedidos": len(latencias), "errores": errores, "segundos": round(duracion, 3),
+            "pedidos_por_segundo": round(len(latencias) / duracion, 1),
+            "p50_ms": round(_percentil(latencias, 50) * 1000, 3),
+            "p99_ms": round(_percentil(latencias, 99) * 1000, 3)}
@@ -0,0 +1,95 @@
+import csv
+import json
+from datetime import datetime
+from Excepciones.excepciones import *
+
+def _fecha(valor):
+    """Fecha en ISO 8601, o vacío si no hay fecha"""
+    return valor.isoformat() if isinstance(valor, datetime) else ""
+
+def filas_vuelos(sistema):
+    """Una fila por vuelo, activo o cancelado"""
+    for vuelo in sistema.vuelos:
+        yield {"codigo": vuelo.codigo, "origen": vuelo.origen, "destino": vuelo.destino,
+               "duracion_horas": vuelo.duracion_horas, "fecha": _fecha(vuelo.fecha),
+               "codigo_compania": vuelo.compania.codigo, "tipo_vuelo": vuelo.tipo_vuelo,
+               "capacidad_asientos": vuelo.capacidad_asientos, "asientos_ocupados": len(vuelo.tickets),
+               "tripulacion_completa": vuelo.validar_tripulacion_completa(), "estado": vuelo.estado}
+
+def filas_tickets(sistema):
+    """Una fila por ticket vendido vigente"""
+    for ticket in sistema.tickets_vendidos:
+        pasajero = ticket.pasajero
+        yield {"codigo_vuelo": ticket.codigo_vuelo, "numero": ticket.numero, "asiento": ticket.asiento,
+               "documento_pasajero": pasajero.documento, "apellido": pasajero.apellido,
+               "nombre": pasajero.nombre, "nacionalidad": pasajero.nacionalidad}
+
+def filas_equipajes(sistema):
+    """Una fila por equipaje en bodega de los vuelos activos"""
+    for vuelo in sistema.obtener_vuelos_activos():
+        for equipaje in vuelo.equipajes:
+            yield {"codigo": equipaje.codigo, "codigo_vuelo": vuelo.codigo,
+                   "documento_pasajero": equipaje.pasajero.documento, "peso": equipaje.peso,
+                   "costo": equipaje.costo, "es_internacional": equipaje.es_internacional}
+
+def filas_tripulacion(sistema):
+    """Una fila por tripulante asignado a un vuelo activo"""
+    for vuelo in sistema.obtener_vuelos_activos():
+        for tripulantes in vuelo.tripulacion.values():
+            for tripulante in tripulantes:
+                yield {"codigo_vuelo": vuelo.codigo, "documento_tripulante": tripulante.documento,
+                       "apellido": tripulante.apellido, "nombre": tripulante.nombre,
+                       "rol": tripulante.rol, "horas_vuelo": tripulante.horas_vuelo}
+
+def filas_cancelaciones(sistema):
+    """Una fila por vuelo cancelado"""
+    for vuelo in sistema.vuelos:
+        if vuelo.estado == "cancelado":
+            yield {"codigo_vuelo": vuelo.codigo, "origen": vuelo.origen, "destino": vuelo.destino,
+                   "fecha": _fecha(vuelo.fecha), "codigo_compania": vuelo.compania.codigo,
+                   "causa": getattr(vuelo, 'causa_cancelacion', ''),
+                   "fecha_cancelacion": _fecha(getattr(vuelo, 'fecha_cancelacion', None))}
+
+def filas_tickets_cancelados(sistema):
+    """Una fila por ticket cancelado"""
+    for ticket in sistema.tickets_cancelados:
+        yield {"codigo_vuelo": ticket.codigo_vuelo, "numero": ticket.numero,
+               "documento_pasajero": ticket.pasajero.documento}
+
+# Entidad exportable -> (columnas, generador de filas)
+ENTIDADES_EXPORTABLES = {
+    "vuelos": (["codigo", "origen", "destino", "duracion_horas", "fecha", "codigo_compania", "tipo_vuelo",
+                "capacidad_asientos", "asientos_ocupados", "tripulacion_completa", "estado"], filas_vuelos),
+    "tickets": (["codigo_vuelo", "numero", "asiento", "documento_pasajero", "apellido", "nombre", "nacionalidad"],
+                filas_tickets),
+    "equipajes": (["codigo", "codigo_vuelo", "documento_pasajero", "peso", "costo", "es_internacional"], filas_equipajes),
+    "tripulacion": (["codigo_vuelo", "documento_tripulante", "apellido", "nombre", "rol", "horas_vuelo"], filas_tripulacion),
+    "cancelaciones": (["codigo_vuelo", "origen", "destino", "fecha", "codigo_compania", "causa",
+                       "fecha_cancelacion"], filas_cancelaciones),
+    "tickets_cancelados": (["codigo_vuelo", "numero", "documento_pasajero"], filas_tickets_cancelados),
+}
+
+def exportar(sistema, entidad, salida, formato="csv"):
+    """Escribe en el archivo de texto `salida` todas las filas de una entidad.
+    
+    Las filas se generan a medida que se escriben, sin armar listas
+    intermedias. Retorna la cantidad de filas escritas.
+    """
+    if entidad not in ENTIDADES_EXPORTABLES:
+        raise DatoInvalidoException(f"Entidad inválida: {entidad}. Debe ser una de: {', '.join(ENTIDADES_EXPORTABLES)}")
+    
+    columnas, generar_filas = ENTIDADES_EXPORTABLES[entidad]
+    cantidad = 0
+    if formato == "csv":
+        escritor = csv.DictWriter(salida, fieldnames=columnas, lineterminator="\n")
+        escritor.writeheader()
+        for fila in generar_filas(sistema):
+            escritor.writerow(fila)
+            cantidad += 1
+    elif formato == "jsonl":
+        for fila in generar_filas(sistema):
+            salida.write(json.dumps(fila, ensure_ascii=False) + "\n")
+            cantidad += 1
+    else:
+        raise DatoInvalidoException(f"Formato inválido: {formato}. Debe ser 'csv' o 'jsonl'")
+    return cantidad
@@ -0,0 +1,168 @@
+import csv
+import json
+from datetime import datetime
+from itertools import islice
+from Excepciones.excepciones import *
+
+FORMATO_FECHA = "%d/%m/%Y %H:%M"
+
+def convertir_fecha(valor):
+    """Convierte una fecha DD/MM/YYYY HH:MM o ISO 8601 a datetime"""
+    if isinstance(valor, datetime):
+        return valor
+    valor = str(valor).strip()
+    try:
+        return datetime.strptime(valor, FORMATO_FECHA)
+    except ValueError:
+        try:
+            return datetime.fromisoformat(valor)
+        except ValueError:
+            raise DatoInvalidoException(f"Fecha inválida: {valor!r}. Use DD/MM/YYYY HH:MM o ISO 8601")
+
+def convertir_texto(valor):
+    """Convierte un valor a texto sin espacios al inicio ni al final"""
+    if isinstance(valor, (list, tuple, dict)):
+        raise DatoInvalidoException(f"Se esperaba un texto: {valor!r}")
+    return str(valor).strip()
+
+def convertir_entero(valor):
+    """Convierte un valor a entero sin redondear (10 o "10", pero no 10.5 ni True)"""
+    if isinstance(valor, bool) or (isinstance(valor, float) and not valor.is_integer()):
+        raise DatoInvalidoException(f"Se esperaba un número entero: {valor!r}")
+    if isinstance(valor, float):
+        return int(valor)
+    try:
+        return int(str(valor).strip())
+    except ValueError:
+        raise DatoInvalidoException(f"Se esperaba un número entero: {valor!r}")
+
+def convertir_decimal(valor):
+    """Convierte un valor a número decimal"""
+    if isinstance(valor, bool):
+        raise DatoInvalidoException(f"Se esperaba un número: {valor!r}")
+    try:
+        return float(str(valor).strip()) if isinstance(valor, str) else float(valor)
+    except (TypeError, ValueError):
+        raise DatoInvalidoException(f"Se esperaba un número: {valor!r}")
+
+def convertir_booleano(valor):
+    """Convierte true/false, sí/no o 1/0 (como valor o como texto) a bool"""
+    if isinstance(valor, bool):
+        return valor
+    texto = str(valor).strip().lower()
+    if texto in ("true", "si", "sí", "1"):
+        return True
+    if texto in ("false", "no", "0"):
+        return False
+    raise DatoInvalidoException(f"Se esperaba verdadero o falso: {valor!r}")
+
+def convertir_decimales(valor):
+    """Convierte una lista (o un texto separado por comas) a una lista de números decimales"""
+    if isinstance(valor, str):
+        valor = [parte for parte in valor.split(",") if parte.strip()]
+    if not isinstance(valor, (list, tuple)):
+        raise DatoInvalidoException(f"Se esperaba una lista de números: {valor!r}")
+    return [convertir_decimal(elemento) for elemento in valor]
+
+# Para cada tipo de registro: método de Sistema, campos obligatorios y campos opcionales con su conversión
+TIPOS_REGISTRO = {
+    "companias": ("registrar_compania",
+                  {"codigo": convertir_texto, "nombre": convertir_texto, "pais_origen": convertir_texto}, {}),
+    "personas": ("registrar_persona",
+                 {"tipo": convertir_texto, "documento": convertir_texto, "apellido": convertir_texto,
+                  "nombre": convertir_texto, "email": convertir_texto, "celular": convertir_texto},
+                 {"nacionalidad": convertir_texto, "rol": convertir_texto,
+                  "fecha_ingreso_compania": convertir_fecha, "horas_vuelo": convertir_decimal}),
+    "vuelos": ("crear_vuelo",
+               {"origen": convertir_texto, "destino": convertir_texto, "duracion_horas": convertir_decimal,
+                "fecha": convertir_fecha, "codigo_compania": convertir_texto,
+                "capacidad_asientos": convertir_entero, "tipo_vuelo": convertir_texto}, {}),
+    "tickets": ("crear_ticket",
+                {"codigo_vuelo": convertir_texto, "documento_pasajero": convertir_texto},
+                {"asiento": convertir_entero}),
+    "tripulacion": ("asignar_personal_vuelo",
+                    {"codigo_vuelo": convertir_texto, "documento_tripulante": convertir_texto}, {}),
+    "equipajes": ("registrar_equipaje",
+                  {"codigo_vuelo": convertir_texto, "numero_ticket": convertir_entero, "peso": convertir_decimal}, {}),
+}
+
+class ResultadoImportacion:
+    """Resultado de una importación: cantidad de filas cargadas y errores por fila"""
+    
+    def __init__(self):
+        self.importados = 0
+        self.errores = []  # Lista de (número de fila, mensaje)
+    
+    def __str__(self):
+        return f"Importados: {self.importados} - Errores: {len(self.errores)}"
+
+def leer_filas(ruta, formato=None):
+    """Recorre las filas de un archivo CSV (como diccionarios) o JSON Lines (como texto), sin cargarlo entero"""
+    formato = formato or ("csv" if ruta.lower().endswith(".csv") else "jsonl")
+    with open(ruta, encoding="utf-8", newline="") as archivo:
+        if formato == "csv":
+            yield from csv.DictReader(archivo)
+        elif formato == "jsonl":
+            for linea in archivo:
+                if linea.strip():
+                    yield linea
+        else:
+            raise DatoInvalidoException(f"Formato inválido: {formato}. Debe ser 'csv' o 'jsonl'")
+
+def _argumentos_fila(fila, obligatorios, opcionales):
+    """Valida y convierte los campos de una fila a los argumentos del método de Sistema"""
+    if isinstance(fila, str):
+        try:
+            fila = json.loads(fila)
+        except ValueError as e:
+            raise DatoInvalidoException(f"JSON inválido: {e}")
+    if not isinstance(fila, dict):
+        raise DatoInvalidoException("Cada fila debe ser un objeto con los campos del registro")
+    argumentos = {}
+    for campo, convertir in obligatorios.items():
+        valor = fila.get(campo)
+        if valor is None or str(valor).strip() == "":
+            raise DatoInvalidoException(f"Falta el campo '{campo}'")
+        argumentos[campo] = convertir(valor)
+    for campo, convertir in opcionales.items():
+        valor = fila.get(campo)
+        if valor is not None and str(valor).strip() != "":
+            argumentos[campo] = convertir(valor)
+    return argumentos
+
+def importar_filas(sistema, filas, tipo, tamano_lote=1000):
+    """Carga en el sistema un iterable de filas de un mismo tipo.
+    
+    Las filas se procesan por lotes de `tamano_lote` y cada una pasa por el
+    mismo método (y las mismas validaciones) que usa el menú. Una fila puede
+    ser un diccionario o el texto JSON de un objeto. Una fila con error (incluso
+    un JSON mal formado) se anota en el resultado y la carga sigue con la siguiente.
+    """
+    if tipo not in TIPOS_REGISTRO:
+        raise DatoInvalidoException(f"Tipo inválido: {tipo}. Debe ser uno de: {', '.join(TIPOS_REGISTRO)}")
+    
+    nombre_metodo, obligatorios, opcionales = TIPOS_REGISTRO[tipo]
+    metodo = getattr(sistema, nombre_metodo)
+    resultado = ResultadoImportacion()
+    filas = iter(filas)
+    numero_fila = 0
+    
+    while True:
+        lote = list(islice(filas, tamano_lote))
+        if not lote:
+            break
+        for fila in lote:
+            numero_fila += 1
+            try:
+                metodo(**_argumentos_fila(fila, obligatorios, opcionales))
+                resultado.importados += 1
+            except (EntidadDuplicadaException, EntidadNoEncontradaException, DatoInvalidoException,
+                    VueloCompletoException, EquipajeInvalidoException, ConflictoTripulacionException,
+                    ValueError, TypeError) as e:
+                resultado.errores.append((numero_fila, str(e)))
+    
+    return resultado
+
+def importar_archivo(sistema, ruta, tipo, formato=None, tamano_lote=1000):
+    """Carga en el sistema un archivo CSV o JSON Lines de un mismo tipo de registro"""
+    return importar_filas(sistema, leer_filas(ruta, formato), tipo, tamano_lote)
\ No newline at end of file
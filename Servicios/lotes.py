@@ -0,0 +1,107 @@
+import json
+from Entidades.persona import Persona
+from Entidades.compania import Compania
+from Entidades.vuelo import Vuelo
+from Entidades.ticket import Ticket
+from Entidades.equipaje import Equipaje
+from Entidades.reserva import Reserva
+from Excepciones.excepciones import *
+from Servicios.importacion import (TIPOS_REGISTRO, convertir_fecha, convertir_texto, convertir_entero,
+                                  convertir_decimal, convertir_booleano, convertir_decimales)
+
+# Operaciones de Sistema que se pueden ejecutar por lote
+OPERACIONES_ESCRITURA = {
+    "registrar_persona", "registrar_compania", "crear_vuelo", "crear_ticket", "asignar_personal_vuelo",
+    "registrar_equipaje", "cancelar_ticket", "cancelar_vuelo", "cancelar_vuelo_por_ruta",
+    "reservar_asiento", "confirmar_reserva", "liberar_reserva", "liberar_reservas_vencidas",
+    "completar_tripulaciones", "definir_tarifa", "recalcular_equipaje",
+}
+OPERACIONES_LECTURA = {
+    "informe_pasajeros_por_vuelo", "informe_personal_asignado", "informe_vuelos_por_compania",
+    "informe_vuelos_cancelados", "visualizar_vuelos", "buscar_vuelos", "buscar_conexiones",
+    "resumen_vuelos_por_compania",
+}
+
+# Conversión de cada argumento al tipo que espera Sistema: los campos de la importación más los
+# propios de las demás operaciones. Los argumentos llegan como JSON o como texto (por ejemplo en la
+# query string del servidor) y se guardan en el journal ya convertidos
+CONVERSIONES = {campo: convertir for _, obligatorios, opcionales in TIPOS_REGISTRO.values()
+                for campo, convertir in {**obligatorios, **opcionales}.items()}
+CONVERSIONES.update({
+    "codigo_vuelo_destino": convertir_texto, "causa": convertir_texto, "codigo_reserva": convertir_texto,
+    "duracion": convertir_decimal, "ahora": convertir_decimal,
+    "limites": convertir_decimales, "precios": convertir_decimales, "es_internacional": convertir_booleano,
+    "desde": convertir_fecha, "hasta": convertir_fecha,
+    "asientos_minimos": convertir_entero, "cantidad": convertir_entero, "conexion_minima_horas": convertir_decimal,
+})
+
+# Errores de una operación que se informan en el resultado sin cortar el lote
+ERRORES_OPERACION = (EntidadDuplicadaException, EntidadNoEncontradaException, DatoInvalidoException,
+                     VueloCompletoException, TripulacionIncompletaException, EquipajeInvalidoException,
+                     ConflictoTripulacionException, ValueError, TypeError)
+
+def describir(resultado):
+    """Convierte el resultado de una operación en datos serializables a JSON"""
+    if isinstance(resultado, Ticket):
+        return {"codigo_vuelo": resultado.codigo_vuelo, "numero": resultado.numero, "asiento": resultado.asiento}
+    if isinstance(resultado, Reserva):
+        return {"codigo": resultado.codigo, "codigo_vuelo": resultado.codigo_vuelo, "asiento": resultado.asiento,
+                "vencimiento": resultado.vencimiento}
+    if isinstance(resultado, Equipaje):
+        return {"codigo": resultado.codigo, "peso": resultado.peso, "costo": resultado.costo}
+    if isinstance(resultado, Vuelo):
+        return {"codigo": resultado.codigo, "origen": resultado.origen, "destino": resultado.destino,
+                "fecha": resultado.fecha.isoformat(), "asientos_disponibles": resultado.obtener_asientos_disponibles()}
+    if isinstance(resultado, list):
+        return [describir(elemento) for elemento in resultado]
+    if isinstance(resultado, Compania):
+        return {"codigo": resultado.codigo}
+    if isinstance(resultado, Persona):
+        return {"documento": resultado.documento, "tipo": resultado.obtener_tipo()}
+    return resultado
+
+def ejecutar_operacion(sistema, operacion, argumentos):
+    """Ejecuta una operación permitida de Sistema y retorna su resultado serializable"""
+    if operacion not in OPERACIONES_ESCRITURA and operacion not in OPERACIONES_LECTURA:
+        raise DatoInvalidoException(f"Operación desconocida: {operacion}")
+    if not isinstance(argumentos, dict):
+        raise DatoInvalidoException("Los argumentos deben ser un objeto JSON")
+    convertidos = {}
+    for campo, valor in argumentos.items():
+        if campo not in CONVERSIONES:
+            raise DatoInvalidoException(f"Argumento desconocido: {campo}")
+        convertidos[campo] = None if valor is None else CONVERSIONES[campo](valor)
+    argumentos = convertidos
+    return describir(getattr(sistema, operacion)(**argumentos))
+
+def procesar_lote(sistema, lineas, salida):
+    """Ejecuta una operación por línea y escribe un resultado JSON por línea.
+    
+    Cada línea es un objeto {"op": nombre, "args": {...}} y puede traer un
+    "id" que se repite en el resultado. Un error en una operación se informa
+    en su resultado y el lote continúa, también si es un error inesperado
+    (por ejemplo un argumento de un tipo que Sistema no admite). Retorna
+    (operaciones, errores).
+    """
+    total = 0
+    errores = 0
+    for numero_linea, linea in enumerate(lineas, start=1):
+        if not linea.strip():
+            continue
+        total += 1
+        respuesta = {"linea": numero_linea}
+        try:
+            comando = json.loads(linea)
+            if not isinstance(comando, dict):
+                raise DatoInvalidoException("Cada línea debe ser un objeto JSON con la operación")
+            if "id" in comando:
+                respuesta["id"] = comando["id"]
+            respuesta["resultado"] = ejecutar_operacion(sistema, comando.get("op"), comando.get("args", {}))
+            respuesta["ok"] = True
+        except Exception as e:
+            errores += 1
+            respuesta["ok"] = False
+            respuesta["error"] = type(e).__name__
+            respuesta["mensaje"] = str(e)
+        salida.write(json.dumps(respuesta, ensure_ascii=False) + "\n")
+    return total, errores
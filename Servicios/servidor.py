@@ -0,0 +1,173 @@
+import asyncio
+import contextlib
+import json
+from urllib.parse import urlsplit, parse_qsl
+from Excepciones.excepciones import *
+from Servicios.lotes import ejecutar_operacion, OPERACIONES_ESCRITURA, OPERACIONES_LECTURA, ERRORES_OPERACION
+
+# Código HTTP para cada error de operación (el resto responde 400)
+ESTADOS_ERROR = {
+    EntidadNoEncontradaException: 404,
+    EntidadDuplicadaException: 409,
+    VueloCompletoException: 409,
+    ConflictoTripulacionException: 409,
+}
+
+RAZONES = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 409: "Conflict",
+           500: "Internal Server Error"}
+
+class CandadoLectoresEscritor:
+    """Candado asyncio que deja pasar varias lecturas a la vez o una sola escritura.
+    
+    Las escrituras que esperan tienen prioridad sobre las lecturas nuevas,
+    para que un flujo constante de lecturas no las postergue indefinidamente.
+    """
+    
+    def __init__(self):
+        self._condicion = asyncio.Condition()
+        self._lectores = 0
+        self._escribiendo = False
+        self._escritores_esperando = 0
+    
+    @contextlib.asynccontextmanager
+    async def lectura(self):
+        """Sección de lectura compartida"""
+        async with self._condicion:
+            await self._condicion.wait_for(lambda: not self._escribiendo and self._escritores_esperando == 0)
+            self._lectores += 1
+        try:
+            yield
+        finally:
+            async with self._condicion:
+                self._lectores -= 1
+                if self._lectores == 0:
+                    self._condicion.notify_all()
+    
+    @contextlib.asynccontextmanager
+    async def escritura(self):
+        """Sección de escritura exclusiva"""
+        async with self._condicion:
+            self._escritores_esperando += 1
+            try:
+                await self._condicion.wait_for(lambda: not self._escribiendo and self._lectores == 0)
+            finally:
+                self._escritores_esperando -= 1
+            self._escribiendo = True
+        try:
+            yield
+        finally:
+            async with self._condicion:
+                self._escribiendo = False
+                self._condicion.notify_all()
+
+class ServidorSistema:
+    """Servicio HTTP/JSON que comparte una instancia de Sistema entre varios puestos.
+    
+    Rutas:
+      POST /operaciones/<operación>  con los argumentos como objeto JSON
+      GET  /operaciones/<operación>?arg=valor  solo para informes y consultas
+    
+    Las conexiones se mantienen abiertas (HTTP/1.1 keep-alive). Las
+    operaciones de lectura se ejecutan en paralelo en hilos aparte; las de
+    escritura de a una, sin lecturas en curso. Cada `intervalo_vencimientos`
+    segundos se liberan las reservas vencidas.
+    """
+    
+    def __init__(self, sistema, host="127.0.0.1", puerto=8080, intervalo_vencimientos=1.0):
+        self.sistema = sistema
+        self.host = host
+        self.puerto = puerto
+        self.intervalo_vencimientos = intervalo_vencimientos
+        self._candado = CandadoLectoresEscritor()
+    
+    async def servir(self):
+        """Atiende conexiones hasta que se cancele la tarea"""
+        servidor = await asyncio.start_server(self._atender, self.host, self.puerto)
+        vencimientos = asyncio.create_task(self._liberar_vencidas())
+        try:
+            async with servidor:
+                await servidor.serve_forever()
+        finally:
+            vencimientos.cancel()
+    
+    async def _liberar_vencidas(self):
+        """Libera periódicamente las reservas vencidas"""
+        while True:
+            await asyncio.sleep(self.intervalo_vencimientos)
+            async with self._candado.escritura():
+                await asyncio.to_thread(self.sistema.liberar_reservas_vencidas)
+    
+    async def _atender(self, lector, escritor):
+        """Atiende todos los pedidos de una conexión"""
+        try:
+            while True:
+                linea = await lector.readline()
+                if not linea:
+                    break
+                try:
+                    metodo, ruta, version = linea.decode("latin-1").split()
+                except ValueError:
+                    await self._responder(escritor, 400, {"ok": False, "mensaje": "Pedido HTTP inválido"}, False)
+                    break
+                
+                encabezados = {}
+                while True:
+                    linea = await lector.readline()
+                    if linea in (b"\r\n", b"\n", b""):
+                        break
+                    nombre, _, valor = linea.decode("latin-1").partition(":")
+                    encabezados[nombre.strip().lower()] = valor.strip()
+                
+                largo = int(encabezados.get("content-length", 0) or 0)
+                cuerpo = await lector.readexactly(largo) if largo else b""
+                
+                conexion = encabezados.get("connection", "").lower()
+                mantener = conexion != "close" if version == "HTTP/1.1" else conexion == "keep-alive"
+                
+                estado, respuesta = await self._resolver(metodo, ruta, cuerpo)
+                await self._responder(escritor, estado, respuesta, mantener)
+                if not mantener:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            escritor.close()
+    
+    async def _resolver(self, metodo, ruta, cuerpo):
+        """Ejecuta la operación pedida y retorna (estado HTTP, respuesta)"""
+        url = urlsplit(ruta)
+        partes = url.path.strip("/").split("/")
+        if len(partes) != 2 or partes[0] != "operaciones":
+            return 404, {"ok": False, "mensaje": f"Ruta desconocida: {url.path}"}
+        operacion = partes[1]
+        
+        if operacion not in OPERACIONES_ESCRITURA and operacion not in OPERACIONES_LECTURA:
+            return 404, {"ok": False, "mensaje": f"Operación desconocida: {operacion}"}
+        
+        try:
+            if metodo == "GET" and operacion in OPERACIONES_LECTURA:
+                argumentos = dict(parse_qsl(url.query))
+            elif metodo == "POST":
+                argumentos = json.loads(cuerpo) if cuerpo else {}
+            else:
+                return 405, {"ok": False, "mensaje": f"Método {metodo} no permitido para {operacion}"}
+            
+            seccion = self._candado.lectura if operacion in OPERACIONES_LECTURA else self._candado.escritura
+            async with seccion():
+                resultado = await asyncio.to_thread(ejecutar_operacion, self.sistema, operacion, argumentos)
+            return 200, {"ok": True, "resultado": resultado}
+        except ERRORES_OPERACION as e:
+            return ESTADOS_ERROR.get(type(e), 400), {"ok": False, "error": type(e).__name__, "mensaje": str(e)}
+        except Exception as e:
+            # Un error inesperado se responde igual, sin cortar la conexión del cliente
+            return 500, {"ok": False, "error": type(e).__name__, "mensaje": str(e)}
+    
+    async def _responder(self, escritor, estado, respuesta, mantener):
+        """Escribe una respuesta JSON"""
+        datos = json.dumps(respuesta, ensure_ascii=False).encode("utf-8")
+        encabezado = (f"HTTP/1.1 {estado} {RAZONES[estado]}\r\n"
+                      f"Content-Type: application/json; charset=utf-8\r\n"
+                      f"Content-Length: {len(datos)}\r\n"
+                      f"Connection: {'keep-alive' if mantener else 'close'}\r\n\r\n")
+        escritor.write(encabezado.encode("latin-1") + datos)
+        await escritor.drain()
@@ -4,456 +4,1122 @@ from Entidades.compania import Compania
 from Entidades.vuelo import Vuelo
 from Entidades.ticket import Ticket
 from Entidades.equipaje import Equipaje
+from Entidades.reserva import Reserva
+from Entidades.tarifario import Tarifario
+from Analitica.almacen_columnar import AlmacenColumnar
 from Excepciones.excepciones import *
-from datetime import datetime
+from datetime import datetime, timedelta
+import bisect
+import contextlib
+import heapq
+import math
+import threading
+import time
 
 class Sistema:
-    """Clase que gestiona todo el sistema del aeropuerto"""
+    """Clase que gestiona todo el sistema del aeropuerto.
+    
+    Es segura para usar desde varios hilos. Las operaciones sobre vuelos
+    toman el candado de cada vuelo involucrado (un conjunto fijo de
+    candados repartidos por código de vuelo); las altas de personas,
+    compañías y vuelos toman el candado del registro. Para evitar
+    deadlocks los candados de vuelos se toman siempre en orden de índice y
+    antes que el del registro.
+    """
+    
+    CANTIDAD_CANDADOS = 64
+    DURACION_RESERVA = 15 * 60  # Segundos que se retiene un asiento reservado
+    CONEXION_MINIMA_HORAS = 1  # Tiempo mínimo entre la llegada de un vuelo y la salida del siguiente
+    DESCANSO_MINIMO_HORAS = 10  # Descanso mínimo de un tripulante entre dos vuelos
+    _ATRIBUTOS_CANDADOS = ("_candado_registro", "_candado_libro", "_candado_vencimientos", "_candados_vuelos",
+                           "_estado_hilos")
     
     def __init__(self):
         self.personas = []  # Clientes y tripulación
         self.companias = []
         self.vuelos = []
-        self.tickets_vendidos = []
+        # Índices para búsquedas O(1) (se mantienen junto con las listas)
+        self._personas_por_documento = {}
+        self._companias_por_codigo = {}
+        self._vuelos_por_codigo = {}
+        # Valores que se repiten mucho (ciudades, países, roles, tipos de vuelo) guardados una sola vez:
+        # las entidades comparten la misma instancia y se pueden comparar por identidad
+        self._valores = {}
+        # Índices de búsqueda: (origen, destino) -> [(fecha, código)] ordenados por fecha. Cada vuelo
+        # figura también bajo (origen, None), (None, destino) y (None, None) para buscar sin ruta completa
+        self._rutas = {}  # Vuelos activos
+        self._rutas_con_asientos = {}  # Vuelos activos con al menos un asiento libre
+        # Libro de tickets: vendidos por (código de vuelo, número) y cancelados en orden
+        self._tickets_vendidos = {}
         self.tickets_cancelados = []
+        self._cancelados_por_vuelo = {}
         self._contador_vuelos = 1
+        self._vencimientos = []  # Heap de (vencimiento, código de vuelo, código de reserva)
+        # Copia por columnas de vuelos, tickets y equipajes para los agregados
+        self.analitica = AlmacenColumnar()
+        self.tarifario = Tarifario()  # Tarifas de equipaje por compañía y ruta
+        self._crear_candados()
+    
+    def __getstate__(self):
+        """Estado para pickle, sin los candados"""
+        return {k: v for k, v in vars(self).items() if k not in self._ATRIBUTOS_CANDADOS}
+    
+    def __setstate__(self, estado):
+        """Restaura el estado de pickle con candados nuevos"""
+        vars(self).update(estado)
+        self._crear_candados()
+    
+    @property
+    def tickets_vendidos(self):
+        """Vista de los tickets vendidos vigentes"""
+        return self._tickets_vendidos.values()
     
     # ========== REGISTROS ==========
     
     def registrar_persona(self, tipo, documento, apellido, nombre, email, celular, **kwargs):
         """Registra una persona (cliente o tripulante) en el sistema"""
-        # Verificar si ya existe
-        if self._buscar_persona_por_documento(documento):
-            raise EntidadDuplicadaException(f"Ya existe una persona con documento {documento}")
-        
-        if tipo.lower() == "cliente":
-            nacionalidad = kwargs.get('nacionalidad')
-            if not nacionalidad:
-                raise DatoInvalidoException("La nacionalidad es requerida para clientes")
-            persona = Cliente(documento, apellido, nombre, email, celular, nacionalidad)
-        elif tipo.lower() == "tripulante":
-            rol = kwargs.get('rol')
-            fecha_ingreso = kwargs.get('fecha_ingreso_compania')
-            horas_vuelo = kwargs.get('horas_vuelo', 0)
-            if not rol:
-                raise DatoInvalidoException("El rol es requerido para tripulantes")
-            persona = Tripulante(documento, apellido, nombre, email, celular, rol, fecha_ingreso, horas_vuelo)
-        else:
-            raise DatoInvalidoException("Tipo de persona inválido. Debe ser 'cliente' o 'tripulante'")
-        
-        self.personas.append(persona)
-        return persona
+        with self._bloquear(registro=True):
+            # Verificar si ya existe
+            if self._buscar_persona_por_documento(documento):
+                raise EntidadDuplicadaException(f"Ya existe una persona con documento {documento}")
+            
+            if tipo.lower() == "cliente":
+                nacionalidad = kwargs.get('nacionalidad')
+                if not nacionalidad:
+                    raise DatoInvalidoException("La nacionalidad es requerida para clientes")
+                persona = Cliente(documento, apellido, nombre, email, celular, self._compartir(nacionalidad))
+            elif tipo.lower() == "tripulante":
+                rol = kwargs.get('rol')
+                fecha_ingreso = kwargs.get('fecha_ingreso_compania')
+                horas_vuelo = kwargs.get('horas_vuelo', 0)
+                if not rol:
+                    raise DatoInvalidoException("El rol es requerido para tripulantes")
+                persona = Tripulante(documento, apellido, nombre, email, celular, rol, fecha_ingreso, horas_vuelo)
+                persona.rol = self._compartir(persona.rol)
+            else:
+                raise DatoInvalidoException("Tipo de persona inválido. Debe ser 'cliente' o 'tripulante'")
+            
+            self.personas.append(persona)
+            self._personas_por_documento[documento] = persona
+            self._notificar("registrar_persona", tipo=tipo, documento=documento, apellido=apellido,
+                            nombre=nombre, email=email, celular=celular, **kwargs)
+            return persona
     
     def registrar_compania(self, codigo, nombre, pais_origen):
         """Registra una compañía aérea en el sistema"""
-        if self._buscar_compania_por_codigo(codigo):
-            raise EntidadDuplicadaException(f"Ya existe una compañía con código {codigo}")
-        
-        compania = Compania(codigo, nombre, pais_origen)
-        self.companias.append(compania)
-        return compania
+        with self._bloquear(registro=True):
+            if self._buscar_compania_por_codigo(codigo):
+                raise EntidadDuplicadaException(f"Ya existe una compañía con código {codigo}")
+            
+            compania = Compania(codigo, nombre, self._compartir(pais_origen))
+            self.companias.append(compania)
+            self._companias_por_codigo[codigo] = compania
+            self._notificar("registrar_compania", codigo=codigo, nombre=nombre, pais_origen=pais_origen)
+            return compania
     
     def crear_vuelo(self, origen, destino, duracion_horas, fecha, codigo_compania, capacidad_asientos, tipo_vuelo):
         """Crea un nuevo vuelo en el sistema"""
-        # Buscar la compañía
-        compania = self._buscar_compania_por_codigo(codigo_compania)
-        if not compania:
-            raise EntidadNoEncontradaException(f"No existe una compañía con código {codigo_compania}")
-        
-        # Generar código único para el vuelo
-        codigo_vuelo = f"{codigo_compania}{self._contador_vuelos:03d}"
-        self._contador_vuelos += 1
-        
-        # Validar tipo de vuelo
-        if tipo_vuelo.lower() not in ["nacional", "internacional"]:
-            raise DatoInvalidoException("El tipo de vuelo debe ser 'nacional' o 'internacional'")
-        
-        vuelo = Vuelo(codigo_vuelo, origen, destino, duracion_horas, fecha, compania, capacidad_asientos, tipo_vuelo)
-        self.vuelos.append(vuelo)
-        return vuelo
-    
-    def crear_ticket(self, codigo_vuelo, documento_pasajero):
-        """Crea un ticket asignando un pasajero a un vuelo"""
-        # Buscar vuelo
-        vuelo = self._buscar_vuelo_por_codigo(codigo_vuelo)
-        if not vuelo:
-            raise EntidadNoEncontradaException(f"No existe un vuelo con código {codigo_vuelo}")
-        
-        if vuelo.estado != "activo":
-            raise DatoInvalidoException("No se pueden crear tickets para vuelos cancelados")
-        
-        # Buscar pasajero
-        pasajero = self._buscar_persona_por_documento(documento_pasajero)
-        if not pasajero or pasajero.obtener_tipo() != "Cliente":
-            raise EntidadNoEncontradaException(f"No existe un cliente con documento {documento_pasajero}")
-        
-        # Verificar que el pasajero no tenga ya un ticket en este vuelo
-        for ticket in vuelo.tickets:
-            if ticket.pasajero.documento == documento_pasajero:
-                raise EntidadDuplicadaException("El pasajero ya tiene un ticket en este vuelo")
-        
-        # Verificar disponibilidad
-        if vuelo.obtener_asientos_disponibles() <= 0:
-            raise VueloCompletoException("No hay asientos disponibles en este vuelo")
-        
-        # Crear ticket con número secuencial
-        numero_ticket = len(vuelo.tickets) + 1
-        ticket = Ticket(numero_ticket, pasajero, codigo_vuelo)
-        
-        vuelo.agregar_ticket(ticket)
-        self.tickets_vendidos.append(ticket)
-        pasajero.agregar_vuelo_historial(codigo_vuelo)
-        
-        return ticket
+        with self._bloquear(registro=True):
+            # Buscar la compañía
+            compania = self._buscar_compania_por_codigo(codigo_compania)
+            if not compania:
+                raise EntidadNoEncontradaException(f"No existe una compañía con código {codigo_compania}")
+            
+            # Validar los datos antes de tomar un código: una falla no debe consumir un número
+            if not isinstance(tipo_vuelo, str) or tipo_vuelo.lower() not in ["nacional", "internacional"]:
+                raise DatoInvalidoException("El tipo de vuelo debe ser 'nacional' o 'internacional'")
+            if not isinstance(origen, str) or not isinstance(destino, str) or not origen or not destino:
+                raise DatoInvalidoException("El origen y el destino deben ser textos no vacíos")
+            if not isinstance(fecha, datetime):
+                raise DatoInvalidoException("La fecha del vuelo debe ser una fecha y hora")
+            if (isinstance(duracion_horas, bool) or not isinstance(duracion_horas, (int, float))
+                    or not math.isfinite(duracion_horas) or duracion_horas <= 0):
+                raise DatoInvalidoException("La duración del vuelo debe ser un número de horas mayor a cero")
+            if isinstance(capacidad_asientos, bool) or not isinstance(capacidad_asientos, int) or capacidad_asientos <= 0:
+                raise DatoInvalidoException("La capacidad de asientos debe ser un número entero mayor a cero")
+            
+            # Generar código único para el vuelo (el contador avanza solo si el vuelo se pudo crear)
+            codigo_vuelo = f"{codigo_compania}{self._contador_vuelos:03d}"
+            vuelo = Vuelo(codigo_vuelo, self._compartir(origen), self._compartir(destino), duracion_horas, fecha,
+                          compania, capacidad_asientos, tipo_vuelo)
+            vuelo.tipo_vuelo = self._compartir(vuelo.tipo_vuelo)
+            self._contador_vuelos += 1
+            self.vuelos.append(vuelo)
+            self._vuelos_por_codigo[codigo_vuelo] = vuelo
+            self._agregar_a_ruta(vuelo)
+            compania.agregar_vuelo(vuelo)
+            self.analitica.agregar_vuelo(vuelo)
+            self._notificar("crear_vuelo", origen=origen, destino=destino, duracion_horas=duracion_horas, fecha=fecha,
+                            codigo_compania=codigo_compania, capacidad_asientos=capacidad_asientos, tipo_vuelo=tipo_vuelo)
+            return vuelo
+    
+    def crear_ticket(self, codigo_vuelo, documento_pasajero, asiento=None, ahora=None):
+        """Crea un ticket asignando un pasajero a un vuelo, en el asiento indicado o en uno libre"""
+        ahora = time.time() if ahora is None else ahora
+        with self._bloquear(codigo_vuelo):
+            # Buscar vuelo
+            vuelo = self._buscar_vuelo_por_codigo(codigo_vuelo)
+            if not vuelo:
+                raise EntidadNoEncontradaException(f"No existe un vuelo con código {codigo_vuelo}")
+            
+            if vuelo.estado != "activo":
+                raise DatoInvalidoException("No se pueden crear tickets para vuelos cancelados")
+            
+            self._liberar_vencidas_de_vuelo(vuelo, ahora)
+            pasajero = self._validar_nuevo_pasajero(vuelo, documento_pasajero, asiento)
+            
+            # Crear ticket con número secuencial
+            numero_ticket = vuelo.generar_numero_ticket()
+            ticket = Ticket(numero_ticket, pasajero, vuelo.codigo, asiento)
+            
+            vuelo.agregar_ticket(ticket)
+            self._registrar_venta(ticket)
+            self._actualizar_disponibilidad(vuelo)
+            
+            # Se registra el asiento asignado para que al reproducir quede el mismo
+            self._notificar("crear_ticket", codigo_vuelo=codigo_vuelo, documento_pasajero=documento_pasajero,
+                            asiento=ticket.asiento, ahora=ahora)
+            return ticket
     
     def asignar_personal_vuelo(self, codigo_vuelo, documento_tripulante):
         """Asigna un tripulante a un vuelo"""
-        # Buscar vuelo
-        vuelo = self._buscar_vuelo_por_codigo(codigo_vuelo)
-        if not vuelo:
-            raise EntidadNoEncontradaException(f"No existe un vuelo con código {codigo_vuelo}")
-        
-        if vuelo.estado != "activo":
-            raise DatoInvalidoException("No se puede asignar personal a vuelos cancelados")
+        with self._bloquear(codigo_vuelo):
+            # Buscar vuelo
+            vuelo = self._buscar_vuelo_por_codigo(codigo_vuelo)
+            if not vuelo:
+                raise EntidadNoEncontradaException(f"No existe un vuelo con código {codigo_vuelo}")
+            
+            if vuelo.estado != "activo":
+                raise DatoInvalidoException("No se puede asignar personal a vuelos cancelados")
+            
+            # Buscar tripulante
+            tripulante = self._buscar_persona_por_documento(documento_tripulante)
+            if not tripulante or tripulante.obtener_tipo() != "Tripulante":
+                raise EntidadNoEncontradaException(f"No existe un tripulante con documento {documento_tripulante}")
+            
+            # Verificar que no esté ya asignado
+            todas_tripulaciones = (vuelo.tripulacion["pilotos"] + 
+                                  vuelo.tripulacion["copilotos"] + 
+                                  vuelo.tripulacion["azafatas"])
+            for t in todas_tripulaciones:
+                if t.documento == documento_tripulante:
+                    raise EntidadDuplicadaException("Este tripulante ya está asignado a este vuelo")
+            
+            self._agendar_tripulante(tripulante, vuelo)
+            vuelo.agregar_tripulante(tripulante)
+            self._notificar("asignar_personal_vuelo", codigo_vuelo=codigo_vuelo, documento_tripulante=documento_tripulante)
+            return True
+    
+    def completar_tripulaciones(self):
+        """Asigna tripulantes a los vuelos activos sin tripulación completa.
         
-        # Buscar tripulante
-        tripulante = self._buscar_persona_por_documento(documento_tripulante)
-        if not tripulante or tripulante.obtener_tipo() != "Tripulante":
-            raise EntidadNoEncontradaException(f"No existe un tripulante con documento {documento_tripulante}")
+        Recorre los vuelos por fecha y, para cada rol que falta, elige entre
+        los tripulantes de ese rol sin superposiciones ni falta de descanso al
+        que tenga menos horas (sus horas_vuelo más las que ya se le asignaron
+        acá), con un heap por rol. Cada asignación se hace con
+        asignar_personal_vuelo. Retorna un resumen con los vuelos que no se
+        pudieron completar y los roles que les faltan.
+        """
+        roles = {"pilotos": ("piloto",), "copilotos": ("copiloto",), "azafatas": ("azafata", "azafato")}
+        candidatos = {rol: [] for rol in roles}  # Heap de (horas, documento, tripulante) por rol
+        for tripulante in self.obtener_tripulantes():
+            for rol, nombres in roles.items():
+                if tripulante.rol in nombres:
+                    candidatos[rol].append((tripulante.horas_vuelo, tripulante.documento, tripulante))
+        for heap in candidatos.values():
+            heapq.heapify(heap)
         
-        # Verificar que no esté ya asignado
-        todas_tripulaciones = (vuelo.tripulacion["pilotos"] + 
-                              vuelo.tripulacion["copilotos"] + 
-                              vuelo.tripulacion["azafatas"])
-        for t in todas_tripulaciones:
-            if t.documento == documento_tripulante:
-                raise EntidadDuplicadaException("Este tripulante ya está asignado a este vuelo")
+        with self._bloquear(registro=True):
+            codigos = [codigo for _, codigo in self._rutas.get((None, None), [])]
         
-        vuelo.agregar_tripulante(tripulante)
-        return True
+        resumen = {"asignados": 0, "vuelos_completados": 0, "sin_completar": {}}
+        descanso = timedelta(hours=self.DESCANSO_MINIMO_HORAS)
+        for codigo in codigos:
+            vuelo = self._buscar_vuelo_por_codigo(codigo)
+            if vuelo.estado != "activo" or vuelo.validar_tripulacion_completa():
+                continue
+            
+            faltantes = []
+            for rol, heap in candidatos.items():
+                if vuelo.tripulacion[rol]:
+                    continue
+                llegada = vuelo.obtener_fecha_llegada()
+                descartados = []
+                while heap:
+                    horas, documento, tripulante = heapq.heappop(heap)
+                    descartados.append((horas, documento, tripulante))
+                    if tripulante.buscar_conflicto(vuelo.fecha, llegada, descanso):
+                        continue
+                    try:
+                        self.asignar_personal_vuelo(codigo, documento)
+                    except (ConflictoTripulacionException, EntidadDuplicadaException, DatoInvalidoException):
+                        continue
+                    descartados[-1] = (horas + vuelo.duracion_horas, documento, tripulante)
+                    resumen["asignados"] += 1
+                    break
+                else:
+                    faltantes.append(rol)
+                for candidato in descartados:
+                    heapq.heappush(heap, candidato)
+            
+            if faltantes:
+                resumen["sin_completar"][codigo] = faltantes
+            else:
+                resumen["vuelos_completados"] += 1
+        return resumen
     
     def registrar_equipaje(self, codigo_vuelo, numero_ticket, peso):
         """Registra equipaje en bodega para un pasajero"""
-        # Buscar vuelo
-        vuelo = self._buscar_vuelo_por_codigo(codigo_vuelo)
-        if not vuelo:
-            raise EntidadNoEncontradaException(f"No existe un vuelo con código {codigo_vuelo}")
-        
-        if vuelo.estado != "activo":
-            raise DatoInvalidoException("No se puede registrar equipaje en vuelos cancelados")
-        
-        # Buscar ticket en el vuelo
-        ticket = None
-        for t in vuelo.tickets:
-            if t.numero == numero_ticket:
-                ticket = t
-                break
-        
-        if not ticket:
-            raise EntidadNoEncontradaException(f"No existe el ticket #{numero_ticket} en el vuelo {codigo_vuelo}")
-        
-        # Verificar que el pasajero no tenga ya equipaje registrado
-        for equipaje in vuelo.equipajes:
-            if equipaje.pasajero.documento == ticket.pasajero.documento:
+        with self._bloquear(codigo_vuelo):
+            # Buscar vuelo
+            vuelo = self._buscar_vuelo_por_codigo(codigo_vuelo)
+            if not vuelo:
+                raise EntidadNoEncontradaException(f"No existe un vuelo con código {codigo_vuelo}")
+            
+            if vuelo.estado != "activo":
+                raise DatoInvalidoException("No se puede registrar equipaje en vuelos cancelados")
+            
+            # Buscar ticket en el vuelo
+            ticket = vuelo.obtener_ticket(numero_ticket)
+            if not ticket:
+                raise EntidadNoEncontradaException(f"No existe el ticket #{numero_ticket} en el vuelo {codigo_vuelo}")
+            
+            # Verificar que el pasajero no tenga ya equipaje registrado
+            if vuelo.cantidad_equipaje(ticket.pasajero.documento):
                 raise EntidadDuplicadaException("Este pasajero ya tiene equipaje registrado en este vuelo")
-        
-        # Validar peso y calcular costo
-        try:
-            costo = Equipaje.calcular_costo(peso, vuelo.es_internacional())
-        except ValueError as e:
-            raise EquipajeInvalidoException(str(e))
-        
-        # Crear equipaje
-        codigo_equipaje = f"{codigo_vuelo}-{numero_ticket}"
-        equipaje = Equipaje(codigo_equipaje, ticket.pasajero, peso, costo, vuelo.es_internacional())
-        vuelo.agregar_equipaje(equipaje)
-        
-        return equipaje
+            
+            # Validar peso y calcular costo según la tarifa del vuelo
+            try:
+                costo = self.tarifario.calcular_costo(vuelo, peso)
+            except ValueError as e:
+                raise EquipajeInvalidoException(str(e))
+            
+            # Crear equipaje
+            codigo_equipaje = f"{codigo_vuelo}-{numero_ticket}"
+            equipaje = Equipaje(codigo_equipaje, ticket.pasajero, peso, costo, vuelo.es_internacional())
+            vuelo.agregar_equipaje(equipaje)
+            self.analitica.agregar_equipaje(equipaje, codigo_vuelo)
+            
+            self._notificar("registrar_equipaje", codigo_vuelo=codigo_vuelo, numero_ticket=numero_ticket, peso=peso)
+            return equipaje
     
     def cancelar_ticket(self, codigo_vuelo, numero_ticket):
         """Cancela un ticket y libera el asiento"""
-        # Buscar vuelo
-        vuelo = self._buscar_vuelo_por_codigo(codigo_vuelo)
-        if not vuelo:
-            raise EntidadNoEncontradaException(f"No existe un vuelo con código {codigo_vuelo}")
-        
-        # Buscar ticket en el vuelo
-        ticket = None
-        for t in vuelo.tickets:
-            if t.numero == numero_ticket:
-                ticket = t
-                break
-        
-        if not ticket:
-            raise EntidadNoEncontradaException(f"No existe el ticket #{numero_ticket} en el vuelo {codigo_vuelo}")
-        
-        # Quitar equipaje si existe
-        codigo_equipaje = f"{codigo_vuelo}-{numero_ticket}"
-        vuelo.quitar_equipaje(codigo_equipaje)
-        
-        # Quitar ticket del vuelo
-        vuelo.quitar_ticket(numero_ticket)
-        
-        # Mover a tickets cancelados
-        self.tickets_cancelados.append(ticket)
-        self.tickets_vendidos = [t for t in self.tickets_vendidos if not (t.numero == numero_ticket and t.codigo_vuelo == codigo_vuelo)]
-        
-        return True
+        with self._bloquear(codigo_vuelo):
+            # Buscar vuelo
+            vuelo = self._buscar_vuelo_por_codigo(codigo_vuelo)
+            if not vuelo:
+                raise EntidadNoEncontradaException(f"No existe un vuelo con código {codigo_vuelo}")
+            
+            # Buscar ticket en el vuelo
+            ticket = vuelo.obtener_ticket(numero_ticket)
+            if not ticket:
+                raise EntidadNoEncontradaException(f"No existe el ticket #{numero_ticket} en el vuelo {codigo_vuelo}")
+            
+            # Quitar equipaje si existe
+            codigo_equipaje = f"{codigo_vuelo}-{numero_ticket}"
+            vuelo.quitar_equipaje(codigo_equipaje)
+            self.analitica.quitar_equipaje(codigo_equipaje)
+            
+            # Quitar ticket del vuelo
+            vuelo.quitar_ticket(numero_ticket)
+            
+            # Mover a tickets cancelados
+            self._registrar_cancelacion(ticket)
+            self._actualizar_disponibilidad(vuelo)
+            
+            self._notificar("cancelar_ticket", codigo_vuelo=codigo_vuelo, numero_ticket=numero_ticket)
+            return True
     
     def cancelar_vuelo(self, codigo_vuelo, codigo_vuelo_destino, causa):
-        """Cancela un vuelo y reasigna pasajeros, personal y equipaje a otro vuelo"""
-        # Buscar vuelo a cancelar
+        """Cancela un vuelo y reasigna pasajeros, personal y equipaje a otro vuelo.
+        
+        Todas las validaciones se hacen antes de mover nada: o se reasigna todo
+        o el sistema queda sin cambios. La excepción son los tripulantes a los
+        que el vuelo destino se les superpone con otro vuelo o no les deja el
+        descanso mínimo: no se reasignan y el resumen del destino lista sus
+        documentos en "tripulantes_sin_reasignar". Retorna un resumen de lo reasignado.
+        """
+        with self._bloquear(codigo_vuelo, codigo_vuelo_destino):
+            # Buscar vuelo a cancelar
+            vuelo_origen = self._buscar_vuelo_por_codigo(codigo_vuelo)
+            if not vuelo_origen:
+                raise EntidadNoEncontradaException(f"No existe un vuelo con código {codigo_vuelo}")
+            
+            if vuelo_origen.estado != "activo":
+                raise DatoInvalidoException("El vuelo ya está cancelado")
+            
+            # Buscar vuelo destino
+            vuelo_destino = self._buscar_vuelo_por_codigo(codigo_vuelo_destino)
+            if not vuelo_destino:
+                raise EntidadNoEncontradaException(f"No existe un vuelo con código {codigo_vuelo_destino}")
+            
+            if vuelo_destino is vuelo_origen:
+                raise DatoInvalidoException("El vuelo destino debe ser distinto del vuelo a cancelar")
+            
+            if vuelo_destino.estado != "activo":
+                raise DatoInvalidoException("El vuelo destino debe estar activo")
+            
+            # Verificar capacidad del vuelo destino (los pasajeros que ya tienen ticket o reserva allí no ocupan otro asiento)
+            plan = [(ticket, vuelo_destino) for ticket in vuelo_origen.tickets]
+            nuevos = sum(1 for ticket, _ in plan if not self._tiene_asiento(vuelo_destino, ticket.pasajero.documento))
+            if vuelo_destino.obtener_asientos_disponibles() < nuevos:
+                raise VueloCompletoException("El vuelo destino no tiene suficientes asientos disponibles")
+            
+            # Reasignar tickets, equipaje y tripulación
+            resumen = self._aplicar_reasignacion(vuelo_origen, plan)
+            datos = resumen.setdefault(vuelo_destino.codigo, {"tickets": 0, "equipajes": 0, "tripulantes": 0})
+            movidos, omitidos = self._transferir_tripulacion(vuelo_origen, vuelo_destino)
+            datos["tripulantes"] = movidos
+            datos["tripulantes_sin_reasignar"] = omitidos
+            
+            self._marcar_cancelado(vuelo_origen, causa)
+            self._notificar("cancelar_vuelo", codigo_vuelo=codigo_vuelo, codigo_vuelo_destino=codigo_vuelo_destino, causa=causa)
+            return resumen
+    
+    def cancelar_vuelo_por_ruta(self, codigo_vuelo, causa):
+        """Cancela un vuelo repartiendo pasajeros y equipaje entre los vuelos activos de la misma ruta.
+        
+        Solo se usan los vuelos que salen en la misma fecha que el cancelado o
+        después, y se llenan por orden de fecha. Si entre todos no hay asientos
+        suficientes no se modifica nada. Un vuelo sin tickets se cancela aunque
+        no haya otros vuelos en la ruta. La tripulación no se reasigna.
+        Retorna un resumen de lo reasignado a cada vuelo.
+        """
         vuelo_origen = self._buscar_vuelo_por_codigo(codigo_vuelo)
         if not vuelo_origen:
             raise EntidadNoEncontradaException(f"No existe un vuelo con código {codigo_vuelo}")
         
-        # Buscar vuelo destino
-        vuelo_destino = self._buscar_vuelo_por_codigo(codigo_vuelo_destino)
-        if not vuelo_destino:
-            raise EntidadNoEncontradaException(f"No existe un vuelo con código {codigo_vuelo_destino}")
-        
-        if vuelo_destino.estado != "activo":
-            raise DatoInvalidoException("El vuelo destino debe estar activo")
-        
-        # Verificar capacidad del vuelo destino
-        if vuelo_destino.obtener_asientos_disponibles() < len(vuelo_origen.tickets):
-            raise VueloCompletoException("El vuelo destino no tiene suficientes asientos disponibles")
-        
-        # Reasignar tickets
-        for ticket_viejo in vuelo_origen.tickets:
-            # Crear nuevo ticket en vuelo destino
-            numero_nuevo = len(vuelo_destino.tickets) + 1
-            ticket_nuevo = Ticket(numero_nuevo, ticket_viejo.pasajero, codigo_vuelo_destino)
-            vuelo_destino.agregar_ticket(ticket_nuevo)
-            
-            # Actualizar en tickets vendidos
-            for i, t in enumerate(self.tickets_vendidos):
-                if t.numero == ticket_viejo.numero and t.codigo_vuelo == codigo_vuelo:
-                    self.tickets_vendidos[i] = ticket_nuevo
-                    break
+        # El registro queda tomado durante toda la cancelación para que la ruta no
+        # cambie: un vuelo que se crea o se cancela en ella queda en el journal
+        # antes o después, y al reproducir se eligen los mismos vuelos. Si la ruta
+        # cambió mientras se esperaban los candados se vuelve a empezar.
+        while True:
+            with self._bloquear(registro=True):
+                codigos = self._codigos_de_ruta_desde(vuelo_origen)
+            
+            with self._bloquear(codigo_vuelo, *codigos, registro=True):
+                if vuelo_origen.estado != "activo":
+                    raise DatoInvalidoException("El vuelo ya está cancelado")
+                if self._codigos_de_ruta_desde(vuelo_origen) != codigos:
+                    continue
+                
+                candidatos = [self._buscar_vuelo_por_codigo(codigo) for codigo in codigos]
+                if not candidatos and vuelo_origen.tickets:
+                    raise EntidadNoEncontradaException(f"No hay otros vuelos activos de {vuelo_origen.origen} a {vuelo_origen.destino} "
+                                                       f"que salgan desde el {vuelo_origen.fecha.strftime('%d/%m/%Y %H:%M')}")
+                
+                # Los pasajeros que ya tienen ticket o reserva en algún vuelo de la ruta se quedan en él
+                plan = []
+                pendientes = []
+                for ticket in vuelo_origen.tickets:
+                    documento = ticket.pasajero.documento
+                    vuelo_actual = next((v for v in candidatos if self._tiene_asiento(v, documento)), None)
+                    if vuelo_actual:
+                        plan.append((ticket, vuelo_actual))
+                    else:
+                        pendientes.append(ticket)
+                
+                # Heap de vuelos con asientos libres, el de fecha más próxima primero
+                libres = {v.codigo: v.obtener_asientos_disponibles() for v in candidatos}
+                if sum(libres.values()) < len(pendientes):
+                    raise VueloCompletoException("Los vuelos de la ruta no tienen suficientes asientos disponibles")
+                
+                disponibles = [(v.fecha, v.codigo, v) for v in candidatos if libres[v.codigo] > 0]
+                heapq.heapify(disponibles)
+                for ticket in pendientes:
+                    fecha, codigo, vuelo = disponibles[0]
+                    plan.append((ticket, vuelo))
+                    libres[codigo] -= 1
+                    if libres[codigo] == 0:
+                        heapq.heappop(disponibles)
+                
+                resumen = self._aplicar_reasignacion(vuelo_origen, plan)
+                self._marcar_cancelado(vuelo_origen, causa)
+                self._notificar("cancelar_vuelo_por_ruta", codigo_vuelo=codigo_vuelo, causa=causa)
+                return resumen
+    
+    def _aplicar_reasignacion(self, vuelo_origen, plan):
+        """Mueve tickets y equipaje de vuelo_origen según plan, una lista de (ticket, vuelo destino).
+        
+        El plan ya debe estar validado (destinos activos y con asientos suficientes).
+        El equipaje se cotiza con la tarifa de su vuelo destino antes de mover
+        nada, así que si alguno no es admitido no se modifica nada.
+        
+        Recorre los tickets y los equipajes una sola vez y retorna, por código
+        de vuelo destino, la cantidad de tickets y equipajes movidos.
+        """
+        costos = self._cotizar_equipajes_reasignados(vuelo_origen, plan)
+        resumen = {}
+        tickets_nuevos = {}  # Documento del pasajero -> ticket en el vuelo destino
+        
+        for ticket_viejo, vuelo_destino in plan:
+            datos = resumen.setdefault(vuelo_destino.codigo, {"tickets": 0, "equipajes": 0, "tripulantes": 0})
+            pasajero = ticket_viejo.pasajero
+            
+            # Si el pasajero ya viajaba en el vuelo destino conserva su ticket; si tenía
+            # una reserva allí, la reserva se convierte en el ticket en el mismo asiento
+            ticket_nuevo = vuelo_destino.obtener_ticket_por_documento(pasajero.documento)
+            if not ticket_nuevo:
+                reserva = vuelo_destino.obtener_reserva_por_documento(pasajero.documento)
+                asiento = None
+                if reserva:
+                    vuelo_destino.quitar_reserva(reserva.codigo)
+                    asiento = reserva.asiento
+                ticket_nuevo = Ticket(vuelo_destino.generar_numero_ticket(), pasajero, vuelo_destino.codigo, asiento)
+                vuelo_destino.agregar_ticket(ticket_nuevo)
+                datos["tickets"] += 1
+            
+            self._reasignar_venta(ticket_viejo, ticket_nuevo)
+            tickets_nuevos[pasajero.documento] = (ticket_nuevo, vuelo_destino)
         
-        # Reasignar equipajes
         for equipaje_viejo in vuelo_origen.equipajes:
-            # Buscar el número de ticket del pasajero en el vuelo destino
-            numero_ticket_nuevo = None
-            for ticket in vuelo_destino.tickets:
-                if ticket.pasajero.documento == equipaje_viejo.pasajero.documento:
-                    numero_ticket_nuevo = ticket.numero
-                    break
+            documento = equipaje_viejo.pasajero.documento
+            if documento not in tickets_nuevos:
+                continue
+            ticket_nuevo, vuelo_destino = tickets_nuevos[documento]
+            if vuelo_destino.cantidad_equipaje(documento):
+                continue
             
-            if numero_ticket_nuevo:
-                codigo_nuevo = f"{codigo_vuelo_destino}-{numero_ticket_nuevo}"
-                equipaje_nuevo = Equipaje(codigo_nuevo, equipaje_viejo.pasajero, 
-                                         equipaje_viejo.peso, equipaje_viejo.costo, 
-                                         vuelo_destino.es_internacional())
-                vuelo_destino.agregar_equipaje(equipaje_nuevo)
+            codigo_nuevo = f"{vuelo_destino.codigo}-{ticket_nuevo.numero}"
+            equipaje_nuevo = Equipaje(codigo_nuevo, equipaje_viejo.pasajero, 
+                                     equipaje_viejo.peso, costos[equipaje_viejo.codigo], 
+                                     vuelo_destino.es_internacional())
+            vuelo_destino.agregar_equipaje(equipaje_nuevo)
+            self.analitica.agregar_equipaje(equipaje_nuevo, vuelo_destino.codigo)
+            resumen[vuelo_destino.codigo]["equipajes"] += 1
+        
+        for codigo in resumen:
+            self._actualizar_disponibilidad(self._buscar_vuelo_por_codigo(codigo))
+        return resumen
+    
+    def _cotizar_equipajes_reasignados(self, vuelo_origen, plan):
+        """Retorna {código de equipaje: costo en su vuelo destino} del equipaje de vuelo_origen que se reasigna.
         
-        # Reasignar tripulación
-        for piloto in vuelo_origen.tripulacion["pilotos"]:
-            if piloto not in vuelo_destino.tripulacion["pilotos"]:
-                vuelo_destino.agregar_tripulante(piloto)
+        Cotiza todo el equipaje de cada vuelo destino en una sola llamada al
+        tarifario. Lanza EquipajeInvalidoException si alguno no es admitido.
+        """
+        destinos = {ticket.pasajero.documento: vuelo_destino for ticket, vuelo_destino in plan}
+        por_destino = {}
+        for equipaje in vuelo_origen.equipajes:
+            vuelo_destino = destinos.get(equipaje.pasajero.documento)
+            if vuelo_destino and not vuelo_destino.cantidad_equipaje(equipaje.pasajero.documento):
+                por_destino.setdefault(vuelo_destino.codigo, (vuelo_destino, []))[1].append(equipaje)
         
-        for copiloto in vuelo_origen.tripulacion["copilotos"]:
-            if copiloto not in vuelo_destino.tripulacion["copilotos"]:
-                vuelo_destino.agregar_tripulante(copiloto)
+        costos = {}
+        for vuelo_destino, equipajes in por_destino.values():
+            try:
+                cotizados = self.tarifario.calcular_costos(vuelo_destino, [equipaje.peso for equipaje in equipajes])
+            except ValueError as e:
+                raise EquipajeInvalidoException(f"Equipaje no admitido en el vuelo {vuelo_destino.codigo}: {e}")
+            costos.update(zip((equipaje.codigo for equipaje in equipajes), cotizados))
+        return costos
+    
+    def _transferir_tripulacion(self, vuelo_origen, vuelo_destino):
+        """Agrega al vuelo destino la tripulación del vuelo origen que no tenga.
         
-        for azafata in vuelo_origen.tripulacion["azafatas"]:
-            if azafata not in vuelo_destino.tripulacion["azafatas"]:
-                vuelo_destino.agregar_tripulante(azafata)
+        No se transfieren los tripulantes que tengan otro vuelo que se
+        superponga con el destino o no les deje el descanso mínimo.
+        Retorna cuántos movió y la lista de documentos de los que no se pudieron mover.
+        """
+        asignados = {t.documento for tripulantes in vuelo_destino.tripulacion.values() for t in tripulantes}
+        movidos = 0
+        omitidos = []
+        for tripulantes in vuelo_origen.tripulacion.values():
+            for tripulante in tripulantes:
+                # El vuelo origen se cancela: deja de ocupar la agenda antes de verificar el destino
+                with self._bloquear(registro=True):
+                    tripulante.quitar_de_agenda(vuelo_origen.fecha, vuelo_origen.codigo)
+                if tripulante.documento not in asignados:
+                    try:
+                        self._agendar_tripulante(tripulante, vuelo_destino)
+                    except ConflictoTripulacionException:
+                        omitidos.append(tripulante.documento)
+                        continue
+                    vuelo_destino.agregar_tripulante(tripulante)
+                    asignados.add(tripulante.documento)
+                    movidos += 1
+        return movidos, omitidos
+    
+    def _marcar_cancelado(self, vuelo, causa):
+        """Cancela un vuelo registrando causa y fecha"""
+        self.analitica.cancelar_vuelo(vuelo)
+        for reserva in list(vuelo.reservas):
+            vuelo.quitar_reserva(reserva.codigo)
+        with self._bloquear(registro=True):
+            # El estado y el contador de la compañía cambian juntos, con el registro tomado
+            vuelo.cancelar()
+            vuelo.compania.registrar_cancelacion()
+            self._quitar_de_ruta(vuelo)
+            for tripulantes in vuelo.tripulacion.values():
+                for tripulante in tripulantes:
+                    tripulante.quitar_de_agenda(vuelo.fecha, vuelo.codigo)
+        vuelo.causa_cancelacion = causa
+        vuelo.fecha_cancelacion = datetime.now()
+    
+    # ========== RESERVAS ==========
+    # Una reserva retiene un asiento (cuenta como ocupado) hasta que se
+    # confirma como ticket, se libera o vence. Los vencimientos se guardan en
+    # un heap; liberar_reservas_vencidas saca solo los que ya vencieron. Las
+    # operaciones que dependen de la hora reciben `ahora` (por defecto
+    # time.time()) para que el journal pueda reproducirlas tal cual.
+    
+    def reservar_asiento(self, codigo_vuelo, documento_pasajero, asiento=None, duracion=None, ahora=None):
+        """Retiene un asiento para un pasajero durante `duracion` segundos. Retorna la reserva"""
+        ahora = time.time() if ahora is None else ahora
+        duracion = self.DURACION_RESERVA if duracion is None else duracion
+        if duracion <= 0:
+            raise DatoInvalidoException("La duración de la reserva debe ser mayor a cero")
+        
+        with self._bloquear(codigo_vuelo):
+            vuelo = self._buscar_vuelo_por_codigo(codigo_vuelo)
+            if not vuelo:
+                raise EntidadNoEncontradaException(f"No existe un vuelo con código {codigo_vuelo}")
+            
+            if vuelo.estado != "activo":
+                raise DatoInvalidoException("No se pueden reservar asientos en vuelos cancelados")
+            
+            self._liberar_vencidas_de_vuelo(vuelo, ahora)
+            pasajero = self._validar_nuevo_pasajero(vuelo, documento_pasajero, asiento)
+            reserva = Reserva(vuelo.generar_codigo_reserva(), pasajero, vuelo.codigo, asiento, ahora, ahora + duracion)
+            vuelo.agregar_reserva(reserva)
+            self._actualizar_disponibilidad(vuelo)
+            with self._candado_vencimientos:
+                heapq.heappush(self._vencimientos, (reserva.vencimiento, codigo_vuelo, reserva.codigo))
+            
+            self._notificar("reservar_asiento", codigo_vuelo=codigo_vuelo, documento_pasajero=documento_pasajero,
+                            asiento=reserva.asiento, duracion=duracion, ahora=ahora)
+            return reserva
+    
+    def confirmar_reserva(self, codigo_vuelo, codigo_reserva, ahora=None):
+        """Convierte una reserva vigente en un ticket en el mismo asiento. Retorna el ticket"""
+        ahora = time.time() if ahora is None else ahora
+        with self._bloquear(codigo_vuelo):
+            vuelo, reserva = self._buscar_reserva(codigo_vuelo, codigo_reserva)
+            if reserva.esta_vencida(ahora):
+                raise DatoInvalidoException(f"La reserva {codigo_reserva} está vencida")
+            if vuelo.obtener_ticket_por_documento(reserva.pasajero.documento):
+                raise EntidadDuplicadaException("El pasajero ya tiene un ticket en este vuelo")
+            
+            vuelo.quitar_reserva(codigo_reserva)
+            ticket = Ticket(vuelo.generar_numero_ticket(), reserva.pasajero, codigo_vuelo, reserva.asiento)
+            vuelo.agregar_ticket(ticket)
+            self._registrar_venta(ticket)
+            
+            self._notificar("confirmar_reserva", codigo_vuelo=codigo_vuelo, codigo_reserva=codigo_reserva, ahora=ahora)
+            return ticket
+    
+    def liberar_reserva(self, codigo_vuelo, codigo_reserva):
+        """Cancela una reserva y libera su asiento. Retorna la reserva"""
+        with self._bloquear(codigo_vuelo):
+            vuelo, reserva = self._buscar_reserva(codigo_vuelo, codigo_reserva)
+            vuelo.quitar_reserva(codigo_reserva)
+            self._actualizar_disponibilidad(vuelo)
+            self._notificar("liberar_reserva", codigo_vuelo=codigo_vuelo, codigo_reserva=codigo_reserva)
+            return reserva
+    
+    def liberar_reservas_vencidas(self, ahora=None):
+        """Libera las reservas vencidas. Retorna cuántas liberó.
         
-        # Cancelar vuelo origen
-        vuelo_origen.cancelar()
-        vuelo_origen.causa_cancelacion = causa
-        vuelo_origen.fecha_cancelacion = datetime.now()
+        Cada vencimiento sale del heap en O(log n); las entradas de reservas
+        ya confirmadas o liberadas se descartan al salir.
+        """
+        ahora = time.time() if ahora is None else ahora
+        liberadas = 0
+        while True:
+            with self._candado_vencimientos:
+                if not self._vencimientos or self._vencimientos[0][0] > ahora:
+                    return liberadas
+                _, codigo_vuelo, codigo_reserva = heapq.heappop(self._vencimientos)
+            
+            with self._bloquear(codigo_vuelo):
+                vuelo = self._buscar_vuelo_por_codigo(codigo_vuelo)
+                reserva = vuelo.obtener_reserva(codigo_reserva)
+                if reserva is not None and reserva.esta_vencida(ahora):
+                    vuelo.quitar_reserva(codigo_reserva)
+                    self._actualizar_disponibilidad(vuelo)
+                    self._notificar("liberar_reserva", codigo_vuelo=codigo_vuelo, codigo_reserva=codigo_reserva)
+                    liberadas += 1
+    
+    # ========== TARIFAS ==========
+    # El costo del equipaje sale del tarifario: tablas de tramos de peso por
+    # compañía y ruta. El equipaje ya registrado conserva su costo hasta que
+    # se recalcula su vuelo.
+    
+    def definir_tarifa(self, limites, precios, es_internacional, codigo_compania=None, origen=None, destino=None):
+        """Define la tabla de tramos de peso (límites en kg, precio de cada tramo) de una compañía, ruta o por defecto"""
+        with self._bloquear(registro=True):
+            if codigo_compania is not None and not self._buscar_compania_por_codigo(codigo_compania):
+                raise EntidadNoEncontradaException(f"No existe una compañía con código {codigo_compania}")
+            try:
+                self.tarifario.definir_tarifa(limites, precios, es_internacional, codigo_compania,
+                                              self._compartir(origen), self._compartir(destino))
+            except ValueError as e:
+                raise DatoInvalidoException(str(e))
+            self._notificar("definir_tarifa", limites=list(limites), precios=list(precios),
+                            es_internacional=es_internacional, codigo_compania=codigo_compania,
+                            origen=origen, destino=destino)
+    
+    def recalcular_equipaje(self, codigo_vuelo):
+        """Vuelve a cotizar todo el equipaje de un vuelo con su tarifa actual. Retorna la cantidad y el total.
         
-        return True
+        Si algún equipaje no es admitido por la tarifa no se modifica nada.
+        """
+        with self._bloquear(codigo_vuelo):
+            vuelo = self._buscar_vuelo_por_codigo(codigo_vuelo)
+            if not vuelo:
+                raise EntidadNoEncontradaException(f"No existe un vuelo con código {codigo_vuelo}")
+            if vuelo.estado != "activo":
+                raise DatoInvalidoException("No se puede recalcular el equipaje de vuelos cancelados")
+            
+            equipajes = list(vuelo.equipajes)
+            try:
+                costos = self.tarifario.calcular_costos(vuelo, [equipaje.peso for equipaje in equipajes])
+            except ValueError as e:
+                raise EquipajeInvalidoException(str(e))
+            for equipaje, costo in zip(equipajes, costos):
+                equipaje.costo = costo
+                self.analitica.actualizar_costo_equipaje(equipaje.codigo, costo)
+            
+            self._notificar("recalcular_equipaje", codigo_vuelo=codigo_vuelo)
+            return {"equipajes": len(equipajes), "total": sum(costos)}
     
     # ========== INFORMES ==========
+    # Cada informe se genera línea a línea con un generador (generar_*), que
+    # puede escribirse directamente en un archivo con writelines(). Los métodos
+    # de siempre unen esas líneas en un único texto.
     
-    def informe_pasajeros_por_vuelo(self, codigo_vuelo):
-        """Genera informe de pasajeros de un vuelo específico"""
+    def generar_informe_pasajeros_por_vuelo(self, codigo_vuelo):
+        """Genera línea a línea el informe de pasajeros de un vuelo específico"""
         vuelo = self._buscar_vuelo_por_codigo(codigo_vuelo)
         if not vuelo:
             raise EntidadNoEncontradaException(f"No existe un vuelo con código {codigo_vuelo}")
         
-        informe = f"\n{'='*80}\n"
-        informe += f"INFORME DE PASAJEROS - VUELO {codigo_vuelo}\n"
-        informe += f"{vuelo.origen} → {vuelo.destino} | {vuelo.fecha.strftime('%d/%m/%Y %H:%M')}\n"
-        informe += f"{'='*80}\n\n"
+        with self._bloquear(codigo_vuelo):
+            tickets = list(vuelo.tickets)
+        
+        yield f"\n{'='*80}\n"
+        yield f"INFORME DE PASAJEROS - VUELO {codigo_vuelo}\n"
+        yield f"{vuelo.origen} → {vuelo.destino} | {vuelo.fecha.strftime('%d/%m/%Y %H:%M')}\n"
+        yield f"{'='*80}\n\n"
         
-        if not vuelo.tickets:
-            informe += "No hay pasajeros registrados en este vuelo.\n"
+        if not tickets:
+            yield "No hay pasajeros registrados en este vuelo.\n"
         else:
-            for ticket in vuelo.tickets:
+            for ticket in tickets:
                 pasajero = ticket.pasajero
                 # Contar equipaje del pasajero
-                cant_equipaje = sum(1 for e in vuelo.equipajes if e.pasajero.documento == pasajero.documento)
+                cant_equipaje = vuelo.cantidad_equipaje(pasajero.documento)
                 
-                informe += f"Ticket #{ticket.numero}\n"
-                informe += f"  Nombre: {pasajero.nombre} {pasajero.apellido}\n"
-                informe += f"  Cédula: {pasajero.documento}\n"
-                informe += f"  Nacionalidad: {pasajero.nacionalidad}\n"
-                informe += f"  Cantidad de equipaje: {cant_equipaje}\n"
-                informe += f"{'-'*80}\n"
+                yield (f"Ticket #{ticket.numero} - Asiento {ticket.asiento}\n"
+                       f"  Nombre: {pasajero.nombre} {pasajero.apellido}\n"
+                       f"  Cédula: {pasajero.documento}\n"
+                       f"  Nacionalidad: {pasajero.nacionalidad}\n"
+                       f"  Cantidad de equipaje: {cant_equipaje}\n"
+                       f"{'-'*80}\n")
         
-        informe += f"\nTotal pasajeros: {len(vuelo.tickets)}\n"
-        informe += f"{'='*80}\n"
-        return informe
+        yield f"\nTotal pasajeros: {len(tickets)}\n"
+        yield f"{'='*80}\n"
     
-    def informe_personal_asignado(self, codigo_vuelo):
-        """Genera informe del personal asignado a un vuelo"""
+    def informe_pasajeros_por_vuelo(self, codigo_vuelo):
+        """Genera informe de pasajeros de un vuelo específico"""
+        return "".join(self.generar_informe_pasajeros_por_vuelo(codigo_vuelo))
+    
+    def generar_informe_personal_asignado(self, codigo_vuelo):
+        """Genera línea a línea el informe del personal asignado a un vuelo"""
         vuelo = self._buscar_vuelo_por_codigo(codigo_vuelo)
         if not vuelo:
             raise EntidadNoEncontradaException(f"No existe un vuelo con código {codigo_vuelo}")
         
-        informe = f"\n{'='*80}\n"
-        informe += f"INFORME DE PERSONAL - VUELO {codigo_vuelo}\n"
-        informe += f"{vuelo.origen} → {vuelo.destino} | {vuelo.fecha.strftime('%d/%m/%Y %H:%M')}\n"
-        informe += f"{'='*80}\n\n"
+        with self._bloquear(codigo_vuelo):
+            tripulacion = {rol: list(tripulantes) for rol, tripulantes in vuelo.tripulacion.items()}
+            completa = vuelo.validar_tripulacion_completa()
         
-        informe += "PILOTOS:\n"
-        if not vuelo.tripulacion["pilotos"]:
-            informe += "  No hay pilotos asignados\n"
+        yield f"\n{'='*80}\n"
+        yield f"INFORME DE PERSONAL - VUELO {codigo_vuelo}\n"
+        yield f"{vuelo.origen} → {vuelo.destino} | {vuelo.fecha.strftime('%d/%m/%Y %H:%M')}\n"
+        yield f"{'='*80}\n\n"
+        
+        yield "PILOTOS:\n"
+        if not tripulacion["pilotos"]:
+            yield "  No hay pilotos asignados\n"
         else:
-            for piloto in vuelo.tripulacion["pilotos"]:
-                informe += f"  - {piloto.nombre} {piloto.apellido} (Doc: {piloto.documento}) - {piloto.horas_vuelo} hrs\n"
+            for piloto in tripulacion["pilotos"]:
+                yield f"  - {piloto.nombre} {piloto.apellido} (Doc: {piloto.documento}) - {piloto.horas_vuelo} hrs\n"
         
-        informe += "\nCOPILOTOS:\n"
-        if not vuelo.tripulacion["copilotos"]:
-            informe += "  No hay copilotos asignados\n"
+        yield "\nCOPILOTOS:\n"
+        if not tripulacion["copilotos"]:
+            yield "  No hay copilotos asignados\n"
         else:
-            for copiloto in vuelo.tripulacion["copilotos"]:
-                informe += f"  - {copiloto.nombre} {copiloto.apellido} (Doc: {copiloto.documento}) - {copiloto.horas_vuelo} hrs\n"
+            for copiloto in tripulacion["copilotos"]:
+                yield f"  - {copiloto.nombre} {copiloto.apellido} (Doc: {copiloto.documento}) - {copiloto.horas_vuelo} hrs\n"
         
-        informe += "\nAZAFATAS/AZAFATOS:\n"
-        if not vuelo.tripulacion["azafatas"]:
-            informe += "  No hay azafatas/azafatos asignados\n"
+        yield "\nAZAFATAS/AZAFATOS:\n"
+        if not tripulacion["azafatas"]:
+            yield "  No hay azafatas/azafatos asignados\n"
         else:
-            for azafata in vuelo.tripulacion["azafatas"]:
-                informe += f"  - {azafata.nombre} {azafata.apellido} (Doc: {azafata.documento}) - {azafata.horas_vuelo} hrs\n"
+            for azafata in tripulacion["azafatas"]:
+                yield f"  - {azafata.nombre} {azafata.apellido} (Doc: {azafata.documento}) - {azafata.horas_vuelo} hrs\n"
         
-        informe += f"\n{'='*80}\n"
+        yield f"\n{'='*80}\n"
         
         # Validar si está completa
-        if vuelo.validar_tripulacion_completa():
-            informe += "✓ Tripulación completa\n"
+        if completa:
+            yield "✓ Tripulación completa\n"
         else:
-            informe += "✗ Tripulación incompleta (se requiere al menos 1 piloto, 1 copiloto y 1 azafata/o)\n"
+            yield "✗ Tripulación incompleta (se requiere al menos 1 piloto, 1 copiloto y 1 azafata/o)\n"
         
-        informe += f"{'='*80}\n"
-        return informe
+        yield f"{'='*80}\n"
     
-    def informe_vuelos_por_compania(self):
-        """Genera tabla comparativa de vuelos por compañía"""
-        informe = f"\n{'='*80}\n"
-        informe += "INFORME DE VUELOS POR COMPAÑÍA\n"
-        informe += f"{'='*80}\n\n"
+    def informe_personal_asignado(self, codigo_vuelo):
+        """Genera informe del personal asignado a un vuelo"""
+        return "".join(self.generar_informe_personal_asignado(codigo_vuelo))
+    
+    def generar_informe_vuelos_por_compania(self):
+        """Genera línea a línea la tabla comparativa de vuelos por compañía.
+        
+        Usa los contadores y la lista de vuelos que mantiene cada compañía,
+        copiados con el candado del registro para que sean consistentes.
+        """
+        with self._bloquear(registro=True):
+            companias = [(compania, compania.cantidad_activos(), compania.cantidad_cancelados(),
+                          [(v.codigo, v.origen, v.destino, v.estado) for v in compania.vuelos])
+                         for compania in self.companias]
         
-        if not self.companias:
-            informe += "No hay compañías registradas.\n"
+        yield f"\n{'='*80}\n"
+        yield "INFORME DE VUELOS POR COMPAÑÍA\n"
+        yield f"{'='*80}\n\n"
+        
+        if not companias:
+            yield "No hay compañías registradas.\n"
         else:
-            for compania in self.companias:
-                vuelos_compania = [v for v in self.vuelos if v.compania.codigo == compania.codigo]
-                vuelos_activos = [v for v in vuelos_compania if v.estado == "activo"]
-                vuelos_cancelados = [v for v in vuelos_compania if v.estado == "cancelado"]
-                
-                informe += f"{compania.nombre} ({compania.codigo}) - {compania.pais_origen}\n"
-                informe += f"  Total de vuelos: {len(vuelos_compania)}\n"
-                informe += f"  Vuelos activos: {len(vuelos_activos)}\n"
-                informe += f"  Vuelos cancelados: {len(vuelos_cancelados)}\n"
+            for compania, activos, cancelados, vuelos_compania in companias:
+                yield f"{compania.nombre} ({compania.codigo}) - {compania.pais_origen}\n"
+                yield f"  Total de vuelos: {len(vuelos_compania)}\n"
+                yield f"  Vuelos activos: {activos}\n"
+                yield f"  Vuelos cancelados: {cancelados}\n"
                 
                 if vuelos_compania:
-                    informe += f"  Vuelos:\n"
-                    for vuelo in vuelos_compania:
-                        informe += f"    • {vuelo.codigo}: {vuelo.origen} → {vuelo.destino} ({vuelo.estado})\n"
+                    yield f"  Vuelos:\n"
+                    for codigo, origen, destino, estado in vuelos_compania:
+                        yield f"    • {codigo}: {origen} → {destino} ({estado})\n"
                 
-                informe += f"{'-'*80}\n"
+                yield f"{'-'*80}\n"
         
-        informe += f"\n{'='*80}\n"
-        return informe
+        yield f"\n{'='*80}\n"
+    
+    def informe_vuelos_por_compania(self):
+        """Genera tabla comparativa de vuelos por compañía"""
+        return "".join(self.generar_informe_vuelos_por_compania())
+    
+    def resumen_vuelos_por_compania(self):
+        """Retorna por compañía la cantidad total de vuelos, de activos y de cancelados"""
+        with self._bloquear(registro=True):
+            return [{"codigo": compania.codigo, "nombre": compania.nombre, "total": compania.cantidad_vuelos(),
+                     "activos": compania.cantidad_activos(), "cancelados": compania.cantidad_cancelados()}
+                    for compania in self.companias]
+    
+    def generar_informe_vuelos_cancelados(self):
+        """Genera línea a línea el historial de vuelos cancelados"""
+        yield f"\n{'='*80}\n"
+        yield "INFORME DE VUELOS CANCELADOS\n"
+        yield f"{'='*80}\n\n"
+        
+        total = 0
+        for vuelo in self.vuelos:
+            if vuelo.estado != "cancelado":
+                continue
+            total += 1
+            causa = getattr(vuelo, 'causa_cancelacion', 'No especificada')
+            fecha_cancel = getattr(vuelo, 'fecha_cancelacion', 'No registrada')
+            if isinstance(fecha_cancel, datetime):
+                fecha_cancel = fecha_cancel.strftime('%d/%m/%Y %H:%M')
+            
+            # Contar pasajeros que tenía el vuelo (ya no están en tickets pero podemos ver tickets cancelados)
+            pasajeros_afectados = self._cancelados_por_vuelo.get(vuelo.codigo, 0)
+            
+            yield (f"Vuelo: {vuelo.codigo}\n"
+                   f"  Ruta: {vuelo.origen} → {vuelo.destino}\n"
+                   f"  Fecha programada: {vuelo.fecha.strftime('%d/%m/%Y %H:%M')}\n"
+                   f"  Fecha de cancelación: {fecha_cancel}\n"
+                   f"  Causa: {causa}\n"
+                   f"  Pasajeros afectados: {pasajeros_afectados}\n"
+                   f"  Compañía: {vuelo.compania.nombre}\n"
+                   f"{'-'*80}\n")
+        
+        if total == 0:
+            yield "No hay vuelos cancelados.\n"
+        
+        yield f"\nTotal de vuelos cancelados: {total}\n"
+        yield f"{'='*80}\n"
     
     def informe_vuelos_cancelados(self):
         """Genera historial de vuelos cancelados"""
-        vuelos_cancelados = [v for v in self.vuelos if v.estado == "cancelado"]
-        
-        informe = f"\n{'='*80}\n"
-        informe += "INFORME DE VUELOS CANCELADOS\n"
-        informe += f"{'='*80}\n\n"
+        return "".join(self.generar_informe_vuelos_cancelados())
+    
+    def generar_visualizacion_vuelos(self):
+        """Genera línea a línea el listado de vuelos programados"""
+        yield f"\n{'='*80}\n"
+        yield "VUELOS PROGRAMADOS\n"
+        yield f"{'='*80}\n\n"
         
-        if not vuelos_cancelados:
-            informe += "No hay vuelos cancelados.\n"
+        if not self.vuelos:
+            yield "No hay vuelos registrados.\n"
         else:
-            for vuelo in vuelos_cancelados:
-                causa = getattr(vuelo, 'causa_cancelacion', 'No especificada')
-                fecha_cancel = getattr(vuelo, 'fecha_cancelacion', 'No registrada')
-                if isinstance(fecha_cancel, datetime):
-                    fecha_cancel = fecha_cancel.strftime('%d/%m/%Y %H:%M')
-                
-                # Contar pasajeros que tenía el vuelo (ya no están en tickets pero podemos ver tickets cancelados)
-                pasajeros_afectados = len([t for t in self.tickets_cancelados if t.codigo_vuelo == vuelo.codigo])
-                
-                informe += f"Vuelo: {vuelo.codigo}\n"
-                informe += f"  Ruta: {vuelo.origen} → {vuelo.destino}\n"
-                informe += f"  Fecha programada: {vuelo.fecha.strftime('%d/%m/%Y %H:%M')}\n"
-                informe += f"  Fecha de cancelación: {fecha_cancel}\n"
-                informe += f"  Causa: {causa}\n"
-                informe += f"  Pasajeros afectados: {pasajeros_afectados}\n"
-                informe += f"  Compañía: {vuelo.compania.nombre}\n"
-                informe += f"{'-'*80}\n"
-        
-        informe += f"\nTotal de vuelos cancelados: {len(vuelos_cancelados)}\n"
-        informe += f"{'='*80}\n"
-        return informe
+            hay_activos = False
+            for vuelo in self.vuelos:
+                if vuelo.estado != "activo":
+                    continue
+                hay_activos = True
+                yield (f"{vuelo.codigo} - {vuelo.origen} → {vuelo.destino}\n"
+                       f"  Fecha: {vuelo.fecha.strftime('%d/%m/%Y %H:%M')}\n"
+                       f"  Duración: {vuelo.duracion_horas} horas\n"
+                       f"  Compañía: {vuelo.compania.nombre}\n"
+                       f"  Tipo: {vuelo.tipo_vuelo.capitalize()}\n"
+                       f"  Asientos: {len(vuelo.tickets)}/{vuelo.capacidad_asientos}\n"
+                       f"  Tripulación completa: {'Sí' if vuelo.validar_tripulacion_completa() else 'No'}\n"
+                       f"{'-'*80}\n")
+            
+            if not hay_activos:
+                yield "No hay vuelos activos.\n"
+        
+        yield f"{'='*80}\n"
     
     def visualizar_vuelos(self):
         """Muestra todos los vuelos programados"""
-        informe = f"\n{'='*80}\n"
-        informe += "VUELOS PROGRAMADOS\n"
-        informe += f"{'='*80}\n\n"
+        return "".join(self.generar_visualizacion_vuelos())
+    
+    # ========== MÉTODOS AUXILIARES ==========
+    
+    @staticmethod
+    def _claves_busqueda(vuelo):
+        """Claves bajo las que figura un vuelo en los índices de búsqueda"""
+        return ((vuelo.origen, vuelo.destino), (vuelo.origen, None), (None, vuelo.destino), (None, None))
+    
+    @staticmethod
+    def _agregar_a_indice(indice, vuelo):
+        """Agrega un vuelo a un índice de búsqueda si no está"""
+        entrada = (vuelo.fecha, vuelo.codigo)
+        for clave in Sistema._claves_busqueda(vuelo):
+            vuelos_clave = indice.setdefault(clave, [])
+            posicion = bisect.bisect_left(vuelos_clave, entrada)
+            if posicion == len(vuelos_clave) or vuelos_clave[posicion] != entrada:
+                vuelos_clave.insert(posicion, entrada)
+    
+    @staticmethod
+    def _quitar_de_indice(indice, vuelo):
+        """Quita un vuelo de un índice de búsqueda si está"""
+        entrada = (vuelo.fecha, vuelo.codigo)
+        for clave in Sistema._claves_busqueda(vuelo):
+            vuelos_clave = indice.get(clave, [])
+            posicion = bisect.bisect_left(vuelos_clave, entrada)
+            if posicion < len(vuelos_clave) and vuelos_clave[posicion] == entrada:
+                del vuelos_clave[posicion]
+    
+    def _agregar_a_ruta(self, vuelo):
+        """Agrega un vuelo nuevo a los índices de búsqueda"""
+        self._agregar_a_indice(self._rutas, vuelo)
+        if vuelo.obtener_asientos_disponibles() > 0:
+            self._agregar_a_indice(self._rutas_con_asientos, vuelo)
+    
+    def _quitar_de_ruta(self, vuelo):
+        """Quita un vuelo de los índices de búsqueda"""
+        self._quitar_de_indice(self._rutas, vuelo)
+        self._quitar_de_indice(self._rutas_con_asientos, vuelo)
+    
+    def _codigos_de_ruta_desde(self, vuelo):
+        """Códigos de los otros vuelos activos de la ruta de un vuelo que salen en su fecha o después"""
+        vuelos_ruta = self._rutas.get((vuelo.origen, vuelo.destino), [])
+        inicio = bisect.bisect_left(vuelos_ruta, (vuelo.fecha,))
+        return [codigo for _, codigo in vuelos_ruta[inicio:] if codigo != vuelo.codigo]
+    
+    def _actualizar_disponibilidad(self, vuelo):
+        """Refleja en el índice de vuelos con asientos libres un cambio de ocupación del vuelo"""
+        with self._bloquear(registro=True):
+            if vuelo.estado == "activo" and vuelo.obtener_asientos_disponibles() > 0:
+                self._agregar_a_indice(self._rutas_con_asientos, vuelo)
+            else:
+                self._quitar_de_indice(self._rutas_con_asientos, vuelo)
+    
+    def _escanear_conexiones(self, origen, destino, desde, conexion_minima, asientos_minimos):
+        """Itinerario de llegada más temprana de origen a destino saliendo desde `desde`, o None.
         
-        if not self.vuelos:
-            informe += "No hay vuelos registrados.\n"
+        Recorre una sola vez, por orden de salida, los vuelos con asientos
+        libres (el índice (None, None), que se mantiene al crear, vender y
+        cancelar) desde `desde` hasta la mejor llegada encontrada a destino.
+        """
+        llegadas = {}  # Ciudad -> (llegada más temprana, vuelo con que se llega)
+        listo = {origen: desde or datetime.min}  # Ciudad -> desde cuándo se puede salir de ella
+        with self._bloquear(registro=True):
+            vuelos_fecha = self._rutas_con_asientos.get((None, None), [])
+            inicio = bisect.bisect_left(vuelos_fecha, desde, key=lambda e: e[0]) if desde is not None else 0
+            for posicion in range(inicio, len(vuelos_fecha)):
+                fecha, codigo = vuelos_fecha[posicion]
+                if destino in llegadas and fecha >= llegadas[destino][0]:
+                    break
+                vuelo = self._vuelos_por_codigo[codigo]
+                if fecha < listo.get(vuelo.origen, datetime.max) or vuelo.destino is origen:
+                    continue
+                if vuelo.obtener_asientos_disponibles() < asientos_minimos:
+                    continue
+                llegada = vuelo.obtener_fecha_llegada()
+                if vuelo.destino not in llegadas or llegada < llegadas[vuelo.destino][0]:
+                    llegadas[vuelo.destino] = (llegada, vuelo)
+                    listo[vuelo.destino] = llegada + conexion_minima
+        
+        if destino not in llegadas:
+            return None
+        itinerario = []
+        ciudad = destino
+        while ciudad is not origen:
+            vuelo = llegadas[ciudad][1]
+            itinerario.append(vuelo)
+            ciudad = vuelo.origen
+        itinerario.reverse()
+        return itinerario
+    
+    def _agendar_tripulante(self, tripulante, vuelo):
+        """Agrega el vuelo a la agenda del tripulante si no se superpone con otro ni le quita el descanso mínimo"""
+        llegada = vuelo.obtener_fecha_llegada()
+        with self._bloquear(registro=True):
+            conflicto = tripulante.buscar_conflicto(vuelo.fecha, llegada, timedelta(hours=self.DESCANSO_MINIMO_HORAS))
+            if conflicto:
+                raise ConflictoTripulacionException(
+                    f"El tripulante {tripulante.documento} tiene el vuelo {conflicto}, que se superpone con "
+                    f"{vuelo.codigo} o no le deja {self.DESCANSO_MINIMO_HORAS} horas de descanso")
+            tripulante.agregar_a_agenda(vuelo.fecha, llegada, vuelo.codigo)
+    
+    def _compartir(self, valor):
+        """Retorna la instancia compartida de un valor repetido, registrándolo si es nuevo"""
+        return self._valores.setdefault(valor, valor)
+    
+    def _validar_nuevo_pasajero(self, vuelo, documento_pasajero, asiento):
+        """Valida que un cliente pueda tomar un asiento en el vuelo (el indicado o cualquiera). Retorna el cliente"""
+        pasajero = self._buscar_persona_por_documento(documento_pasajero)
+        if not pasajero or pasajero.obtener_tipo() != "Cliente":
+            raise EntidadNoEncontradaException(f"No existe un cliente con documento {documento_pasajero}")
+        
+        # Verificar que el pasajero no tenga ya un ticket o una reserva en este vuelo
+        if vuelo.obtener_ticket_por_documento(documento_pasajero):
+            raise EntidadDuplicadaException("El pasajero ya tiene un ticket en este vuelo")
+        if vuelo.obtener_reserva_por_documento(documento_pasajero):
+            raise EntidadDuplicadaException("El pasajero ya tiene una reserva en este vuelo")
+        
+        # Verificar disponibilidad
+        if vuelo.obtener_asientos_disponibles() <= 0:
+            raise VueloCompletoException("No hay asientos disponibles en este vuelo")
+        
+        if asiento is not None:
+            if not 1 <= asiento <= vuelo.capacidad_asientos:
+                raise DatoInvalidoException(f"El asiento debe estar entre 1 y {vuelo.capacidad_asientos}")
+            if vuelo.asientos.esta_ocupado(asiento):
+                raise EntidadDuplicadaException(f"El asiento {asiento} ya está ocupado")
+        return pasajero
+    
+    def _liberar_vencidas_de_vuelo(self, vuelo, ahora):
+        """Libera las reservas vencidas de un vuelo, que si no ocupan el asiento hasta el próximo barrido.
+        
+        No se registran aparte: la operación que la llama guarda su `ahora` y
+        al reproducirla se liberan las mismas reservas.
+        """
+        vencidas = [reserva.codigo for reserva in vuelo.reservas if reserva.esta_vencida(ahora)]
+        for codigo_reserva in vencidas:
+            vuelo.quitar_reserva(codigo_reserva)
+        if vencidas:
+            self._actualizar_disponibilidad(vuelo)
+    
+    @staticmethod
+    def _tiene_asiento(vuelo, documento):
+        """True si el pasajero ya tiene un ticket o una reserva en el vuelo"""
+        return bool(vuelo.obtener_ticket_por_documento(documento) or vuelo.obtener_reserva_por_documento(documento))
+    
+    def _buscar_reserva(self, codigo_vuelo, codigo_reserva):
+        """Busca una reserva pendiente. Retorna (vuelo, reserva)"""
+        vuelo = self._buscar_vuelo_por_codigo(codigo_vuelo)
+        if not vuelo:
+            raise EntidadNoEncontradaException(f"No existe un vuelo con código {codigo_vuelo}")
+        reserva = vuelo.obtener_reserva(codigo_reserva)
+        if not reserva:
+            raise EntidadNoEncontradaException(f"No existe la reserva {codigo_reserva} en el vuelo {codigo_vuelo}")
+        return vuelo, reserva
+    
+    def _registrar_venta(self, ticket):
+        """Agrega un ticket al libro de tickets vendidos y al historial del pasajero"""
+        with self._candado_libro:
+            self._tickets_vendidos[(ticket.codigo_vuelo, ticket.numero)] = ticket
+            ticket.pasajero.agregar_vuelo_historial(ticket.codigo_vuelo)
+            self.analitica.agregar_ticket(ticket)
+    
+    def _registrar_cancelacion(self, ticket):
+        """Pasa un ticket de vendidos a cancelados"""
+        with self._candado_libro:
+            self._tickets_vendidos.pop((ticket.codigo_vuelo, ticket.numero), None)
+            self.tickets_cancelados.append(ticket)
+            self.analitica.quitar_ticket(ticket)
+            self._cancelados_por_vuelo[ticket.codigo_vuelo] = self._cancelados_por_vuelo.get(ticket.codigo_vuelo, 0) + 1
+    
+    def _reasignar_venta(self, ticket_viejo, ticket_nuevo):
+        """Reemplaza en el libro un ticket vendido por su reasignación"""
+        with self._candado_libro:
+            self._tickets_vendidos.pop((ticket_viejo.codigo_vuelo, ticket_viejo.numero), None)
+            self.analitica.quitar_ticket(ticket_viejo)
+            self._registrar_venta(ticket_nuevo)
+    
+    def _crear_candados(self):
+        """Crea los candados del sistema"""
+        self._candado_registro = threading.RLock()  # Personas, compañías, vuelos y rutas
+        self._candado_libro = threading.RLock()  # Libro de tickets e historiales de pasajeros
+        self._candado_vencimientos = threading.Lock()  # Heap de vencimientos de reservas
+        self._candados_vuelos = [threading.RLock() for _ in range(self.CANTIDAD_CANDADOS)]
+        self._estado_hilos = threading.local()
+    
+    @contextlib.contextmanager
+    def _bloquear(self, *codigos_vuelo, registro=False, todos_los_vuelos=False):
+        """Toma los candados de los vuelos indicados (en orden de índice) y, si se pide, el del registro.
+        
+        Un hilo que ya tiene candados de vuelos no debe pedir otros distintos.
+        Al soltar el último candado del hilo se llama a _al_liberar_candados.
+        """
+        if todos_los_vuelos:
+            indices = range(len(self._candados_vuelos))
         else:
-            vuelos_activos = [v for v in self.vuelos if v.estado == "activo"]
-            
-            if not vuelos_activos:
-                informe += "No hay vuelos activos.\n"
-            else:
-                for vuelo in vuelos_activos:
-                    informe += f"{vuelo.codigo} - {vuelo.origen} → {vuelo.destino}\n"
-                    informe += f"  Fecha: {vuelo.fecha.strftime('%d/%m/%Y %H:%M')}\n"
-                    informe += f"  Duración: {vuelo.duracion_horas} horas\n"
-                    informe += f"  Compañía: {vuelo.compania.nombre}\n"
-                    informe += f"  Tipo: {vuelo.tipo_vuelo.capitalize()}\n"
-                    informe += f"  Asientos: {len(vuelo.tickets)}/{vuelo.capacidad_asientos}\n"
-                    informe += f"  Tripulación completa: {'Sí' if vuelo.validar_tripulacion_completa() else 'No'}\n"
-                    informe += f"{'-'*80}\n"
-        
-        informe += f"{'='*80}\n"
-        return informe
+            indices = sorted({hash(codigo) % len(self._candados_vuelos) for codigo in codigos_vuelo})
+        
+        self._estado_hilos.profundidad = getattr(self._estado_hilos, "profundidad", 0) + 1
+        try:
+            with contextlib.ExitStack() as candados:
+                for indice in indices:
+                    candados.enter_context(self._candados_vuelos[indice])
+                if registro:
+                    candados.enter_context(self._candado_registro)
+                yield
+        finally:
+            self._estado_hilos.profundidad -= 1
+        if self._estado_hilos.profundidad == 0:
+            self._al_liberar_candados()
     
-    # ========== MÉTODOS AUXILIARES ==========
+    def _notificar(self, operacion, **argumentos):
+        """Se llama al final de cada operación que modifica el sistema, todavía con sus candados.
+        
+        No hace nada; las subclases lo usan para registrar la operación.
+        """
+        pass
+    
+    def _al_liberar_candados(self):
+        """Se llama cuando un hilo suelta todos sus candados. Las subclases pueden redefinirlo"""
+        pass
     
     def _buscar_persona_por_documento(self, documento):
         """Busca una persona por su documento"""
-        for persona in self.personas:
-            if persona.documento == documento:
-                return persona
-        return None
+        return self._personas_por_documento.get(documento)
     
     def _buscar_compania_por_codigo(self, codigo):
         """Busca una compañía por su código"""
-        for compania in self.companias:
-            if compania.codigo == codigo:
-                return compania
-        return None
+        return self._companias_por_codigo.get(codigo)
     
     def _buscar_vuelo_por_codigo(self, codigo):
         """Busca un vuelo por su código"""
-        for vuelo in self.vuelos:
-            if vuelo.codigo == codigo:
-                return vuelo
-        return None
+        return self._vuelos_por_codigo.get(codigo)
     
     def obtener_clientes(self):
         """Retorna lista de clientes"""
@@ -465,4 +1131,48 @@ class Sistema:
     
     def obtener_vuelos_activos(self):
         """Retorna lista de vuelos activos"""
-        return [v for v in self.vuelos if v.estado == "activo"]
\ No newline at end of file
+        return [v for v in self.vuelos if v.estado == "activo"]
+    
+    def buscar_vuelos(self, origen=None, destino=None, desde=None, hasta=None, asientos_minimos=1):
+        """Busca vuelos activos por ruta, rango de fechas (inclusive) y asientos libres, ordenados por fecha.
+        
+        Origen, destino y las fechas son opcionales. Usa los índices por ruta:
+        el costo es logarítmico más la cantidad de vuelos con asientos libres
+        en el rango (con asientos_minimos=1, exactamente los del resultado).
+        """
+        indice = self._rutas_con_asientos if asientos_minimos > 0 else self._rutas
+        with self._bloquear(registro=True):
+            vuelos_clave = indice.get((origen, destino), [])
+            inicio = bisect.bisect_left(vuelos_clave, desde, key=lambda e: e[0]) if desde is not None else 0
+            fin = bisect.bisect_right(vuelos_clave, hasta, key=lambda e: e[0]) if hasta is not None else len(vuelos_clave)
+            codigos = [codigo for _, codigo in vuelos_clave[inicio:fin]]
+        
+        vuelos = map(self._buscar_vuelo_por_codigo, codigos)
+        if asientos_minimos <= 1:
+            return list(vuelos)
+        return [v for v in vuelos if v.obtener_asientos_disponibles() >= asientos_minimos]
+    
+    def buscar_conexiones(self, origen, destino, desde=None, cantidad=3, conexion_minima_horas=None, asientos_minimos=1):
+        """Busca itinerarios de origen a destino, directos o con escalas, que lleguen lo antes posible.
+        
+        Retorna hasta `cantidad` itinerarios (listas de vuelos), cada uno
+        saliendo después que el anterior. Entre un vuelo y el siguiente debe
+        haber al menos `conexion_minima_horas`. Solo usa vuelos activos con
+        asientos libres.
+        """
+        if origen == destino:
+            raise DatoInvalidoException("El origen y el destino deben ser distintos")
+        # Con las instancias compartidas las ciudades se comparan por identidad
+        origen = self._valores.get(origen, origen)
+        destino = self._valores.get(destino, destino)
+        conexion_minima = timedelta(hours=self.CONEXION_MINIMA_HORAS if conexion_minima_horas is None else conexion_minima_horas)
+        
+        itinerarios = []
+        while len(itinerarios) < cantidad:
+            itinerario = self._escanear_conexiones(origen, destino, desde, conexion_minima, asientos_minimos)
+            if not itinerario:
+                break
+            itinerarios.append(itinerario)
+            # El siguiente itinerario debe salir después que este
+            desde = itinerario[0].fecha + timedelta(microseconds=1)
+        return itinerarios
\ No newline at end of file
@@ -1,11 +1,24 @@
-from Sistema import Sistema
+from Persistencia import SistemaPersistente, DIRECTORIO_DATOS
+from Servicios.importacion import importar_archivo, TIPOS_REGISTRO
+from Servicios.exportacion import exportar, ENTIDADES_EXPORTABLES
+from Servicios.lotes import procesar_lote
+from Servicios.servidor import ServidorSistema
+from Servicios.carga import generar_carga
 from Excepciones.excepciones import *
 from datetime import datetime
+import argparse
+import asyncio
+import json
+import sys
 
 def limpiar_pantalla():
     """Limpia la pantalla (funciona en Windows y Unix)"""
     import os
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if os.name == 'nt':
+        os.system('cls')
+    else:
+        # Secuencia ANSI: evita lanzar un proceso 'clear' en cada pantalla
+        print("\033[2J\033[H", end="", flush=True)
 
 def pausar():
     """Pausa la ejecución hasta que el usuario presione Enter"""
@@ -190,10 +203,14 @@ def crear_ticket(sistema):
     try:
         codigo_vuelo = solicitar_texto("\nCódigo de vuelo: ").upper()
         documento_pasajero = solicitar_texto("Documento del pasajero: ")
+        asiento = input("Asiento (Enter para asignar uno libre): ").strip()
+        asiento = int(asiento) if asiento else None
         
-        ticket = sistema.crear_ticket(codigo_vuelo, documento_pasajero)
+        ticket = sistema.crear_ticket(codigo_vuelo, documento_pasajero, asiento)
         print(f"\n✓ Ticket creado exitosamente:")
         print(f"  {ticket}")
+    except ValueError:
+        print("\n✗ Error: El asiento debe ser un número entero")
     except (EntidadNoEncontradaException, EntidadDuplicadaException, 
             VueloCompletoException, DatoInvalidoException) as e:
         print(f"\n✗ Error: {e}")
@@ -235,7 +252,8 @@ def asignar_personal(sistema):
         
         sistema.asignar_personal_vuelo(codigo_vuelo, documento_tripulante)
         print(f"\n✓ Tripulante asignado exitosamente al vuelo {codigo_vuelo}")
-    except (EntidadNoEncontradaException, EntidadDuplicadaException, DatoInvalidoException) as e:
+    except (EntidadNoEncontradaException, EntidadDuplicadaException, DatoInvalidoException,
+            ConflictoTripulacionException) as e:
         print(f"\n✗ Error: {e}")
     
     pausar()
@@ -258,7 +276,7 @@ def registrar_equipaje(sistema):
     for vuelo in vuelos_con_tickets:
         print(f"\n  Vuelo {vuelo.codigo}:")
         for ticket in vuelo.tickets:
-            tiene_equipaje = any(e.pasajero.documento == ticket.pasajero.documento for e in vuelo.equipajes)
+            tiene_equipaje = vuelo.cantidad_equipaje(ticket.pasajero.documento) > 0
             estado = "✓ Con equipaje" if tiene_equipaje else "○ Sin equipaje"
             print(f"    Ticket #{ticket.numero}: {ticket.pasajero.nombre} {ticket.pasajero.apellido} {estado}")
     
@@ -339,13 +357,33 @@ def cancelar_vuelo(sistema):
     
     try:
         codigo_vuelo = solicitar_texto("\nCódigo del vuelo a cancelar: ").upper()
-        codigo_vuelo_destino = solicitar_texto("Código del vuelo para reasignar: ").upper()
-        causa = solicitar_texto("Causa de la cancelación: ")
         
-        sistema.cancelar_vuelo(codigo_vuelo, codigo_vuelo_destino, causa)
-        print(f"\n✓ Vuelo cancelado exitosamente")
-        print(f"  Pasajeros, personal y equipaje reasignados al vuelo {codigo_vuelo_destino}")
-    except (EntidadNoEncontradaException, VueloCompletoException, DatoInvalidoException) as e:
+        print("\nReasignación:")
+        print("1. A un vuelo determinado")
+        print("2. Repartir entre los vuelos posteriores de la misma ruta")
+        modo = solicitar_entero("Seleccione opción: ")
+        
+        if modo == 2:
+            causa = solicitar_texto("Causa de la cancelación: ")
+            resumen = sistema.cancelar_vuelo_por_ruta(codigo_vuelo, causa)
+            print(f"\n✓ Vuelo cancelado exitosamente")
+            if resumen:
+                print(f"  Pasajeros y equipaje repartidos entre {len(resumen)} vuelos:")
+            for codigo, movidos in resumen.items():
+                print(f"    {codigo}: {movidos['tickets']} tickets - {movidos['equipajes']} equipajes")
+        else:
+            codigo_vuelo_destino = solicitar_texto("Código del vuelo para reasignar: ").upper()
+            causa = solicitar_texto("Causa de la cancelación: ")
+            
+            resumen = sistema.cancelar_vuelo(codigo_vuelo, codigo_vuelo_destino, causa)
+            movidos = resumen[codigo_vuelo_destino]
+            print(f"\n✓ Vuelo cancelado exitosamente")
+            print(f"  Pasajeros, personal y equipaje reasignados al vuelo {codigo_vuelo_destino}")
+            print(f"  Tickets: {movidos['tickets']} - Equipajes: {movidos['equipajes']} - Tripulantes: {movidos['tripulantes']}")
+            if movidos['tripulantes_sin_reasignar']:
+                print(f"  Tripulantes sin reasignar por superposición o falta de descanso: "
+                      f"{', '.join(movidos['tripulantes_sin_reasignar'])}")
+    except (EntidadNoEncontradaException, VueloCompletoException, DatoInvalidoException, EquipajeInvalidoException) as e:
         print(f"\n✗ Error: {e}")
     
     pausar()
@@ -417,10 +455,16 @@ def menu_informes(sistema):
             print("\n✗ Opción inválida")
             pausar()
 
-def menu_principal():
+def menu_principal(directorio_datos=DIRECTORIO_DATOS):
     """Menú principal del sistema"""
-    sistema = Sistema()
-    
+    sistema = SistemaPersistente(directorio_datos)
+    try:
+        ejecutar_menu_principal(sistema)
+    finally:
+        sistema.cerrar()
+
+def ejecutar_menu_principal(sistema):
+    """Bucle del menú principal"""
     while True:
         limpiar_pantalla()
         print("="*60)
@@ -469,5 +513,105 @@ def menu_principal():
             print("\n✗ Opción inválida")
             pausar()
 
+def importar(argumentos):
+    """Importa un archivo CSV o JSON Lines en los datos guardados del sistema"""
+    sistema = SistemaPersistente(argumentos.datos)
+    try:
+        resultado = importar_archivo(sistema, argumentos.archivo, argumentos.tipo, argumentos.formato)
+    finally:
+        sistema.cerrar()
+    
+    for numero_fila, mensaje in resultado.errores:
+        print(f"Fila {numero_fila}: {mensaje}")
+    print(resultado)
+
+def exportar_datos(argumentos):
+    """Exporta una entidad de los datos guardados a CSV o JSON Lines"""
+    sistema = SistemaPersistente(argumentos.datos)
+    try:
+        if argumentos.salida == "-":
+            exportar(sistema, argumentos.entidad, sys.stdout, argumentos.formato)
+        else:
+            with open(argumentos.salida, "w", encoding="utf-8", newline="", buffering=1 << 20) as salida:
+                cantidad = exportar(sistema, argumentos.entidad, salida, argumentos.formato)
+            print(f"Exportadas {cantidad} filas de {argumentos.entidad} a {argumentos.salida}")
+    finally:
+        sistema.cerrar()
+
+def ejecutar_lote(argumentos):
+    """Ejecuta un lote de operaciones JSON Lines sin menú ni pausas"""
+    sistema = SistemaPersistente(argumentos.datos)
+    try:
+        if argumentos.archivo == "-":
+            total, errores = procesar_lote(sistema, sys.stdin, sys.stdout)
+        else:
+            with open(argumentos.archivo, encoding="utf-8") as entrada:
+                total, errores = procesar_lote(sistema, entrada, sys.stdout)
+    finally:
+        sistema.cerrar()
+    print(f"Operaciones: {total} - Errores: {errores}", file=sys.stderr)
+
+def iniciar_servidor(argumentos):
+    """Sirve el sistema por HTTP/JSON hasta que se interrumpa con Ctrl+C"""
+    sistema = SistemaPersistente(argumentos.datos)
+    servidor = ServidorSistema(sistema, argumentos.host, argumentos.puerto)
+    print(f"Sirviendo en http://{argumentos.host}:{argumentos.puerto}/operaciones/ (Ctrl+C para terminar)", file=sys.stderr)
+    try:
+        asyncio.run(servidor.servir())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sistema.cerrar()
+
+def medir_carga(argumentos):
+    """Genera carga contra un servidor y muestra latencias y rendimiento"""
+    resultado = asyncio.run(generar_carga(argumentos.host, argumentos.puerto, argumentos.conexiones,
+                                          argumentos.pedidos, argumentos.escrituras))
+    print(json.dumps(resultado))
+
+def main():
+    """Punto de entrada: sin argumentos abre el menú, con un comando lo ejecuta sin interacción"""
+    parser = argparse.ArgumentParser(description="Sistema de gestión de aeropuerto Mercosur")
+    parser.add_argument("--datos", default=DIRECTORIO_DATOS, help="directorio de datos del sistema")
+    comandos = parser.add_subparsers(dest="comando")
+    
+    comando_importar = comandos.add_parser("importar", help="importación masiva desde CSV o JSON Lines")
+    comando_importar.add_argument("tipo", choices=list(TIPOS_REGISTRO))
+    comando_importar.add_argument("archivo")
+    comando_importar.add_argument("--formato", choices=["csv", "jsonl"])
+    
+    comando_exportar = comandos.add_parser("exportar", help="exportación a CSV o JSON Lines")
+    comando_exportar.add_argument("entidad", choices=list(ENTIDADES_EXPORTABLES))
+    comando_exportar.add_argument("--formato", choices=["csv", "jsonl"], default="csv")
+    comando_exportar.add_argument("--salida", default="-", help="archivo de salida ('-' para la salida estándar)")
+    
+    comando_lote = comandos.add_parser("lote", help="ejecuta operaciones JSON Lines ({\"op\": ..., \"args\": {...}})")
+    comando_lote.add_argument("archivo", nargs="?", default="-", help="archivo de operaciones ('-' para la entrada estándar)")
+    
+    comando_servidor = comandos.add_parser("servidor", help="servicio HTTP/JSON compartido")
+    comando_servidor.add_argument("--host", default="127.0.0.1")
+    comando_servidor.add_argument("--puerto", type=int, default=8080)
+    
+    comando_carga = comandos.add_parser("carga", help="genera carga contra el servidor y mide p50/p99")
+    comando_carga.add_argument("--host", default="127.0.0.1")
+    comando_carga.add_argument("--puerto", type=int, default=8080)
+    comando_carga.add_argument("--conexiones", type=int, default=16)
+    comando_carga.add_argument("--pedidos", type=int, default=2000)
+    comando_carga.add_argument("--escrituras", type=float, default=0.2, help="proporción de pedidos de escritura")
+    
+    argumentos = parser.parse_args()
+    if argumentos.comando == "importar":
+        importar(argumentos)
+    elif argumentos.comando == "exportar":
+        exportar_datos(argumentos)
+    elif argumentos.comando == "lote":
+        ejecutar_lote(argumentos)
+    elif argumentos.comando == "servidor":
+        iniciar_servidor(argumentos)
+    elif argumentos.comando == "carga":
+        medir_carga(argumentos)
+    else:
+        menu_principal(argumentos.datos)
+
 if __name__ == "__main__":
-    menu_principal()
\ No newline at end of file
+    main()
\ No newline at end of file